@@ -268,10 +268,16 @@ class MACrossoverConfig:
     # ========================================
     # 배치 처리 설정 (Batch Processing Settings)
     # Rate Limit 방지를 위한 배치 처리
+    # 하이브리드 전략은 동시 조회 시에도 같은 값으로 호출 속도를 제한
+    # (초당 1/API_DELAY회, BATCH_SIZE회 호출마다 BATCH_DELAY초 추가 대기)
     # ========================================
     batch_size: int = int(os.getenv("BATCH_SIZE", "5"))              # 한 배치당 종목 수 (10분봉용)
     batch_delay: float = float(os.getenv("BATCH_DELAY", "3.0"))      # 배치 간 대기 시간 (초)
     api_delay: float = float(os.getenv("API_DELAY", "1.0"))          # API 호출 간 대기 시간 (초)
+    api_workers: int = int(os.getenv("API_WORKERS", "8"))            # 동시 조회 스레드 수 (하이브리드 전략)
+    api_rate_limit: float = float(os.getenv("API_RATE_LIMIT", "0"))  # 초당 최대 API 호출 수 (0이면 1/API_DELAY, 최대 20)
+    api_rate_burst: int = int(os.getenv("API_RATE_BURST", "1"))      # 유휴 후 즉시 허용할 연속 호출 수 (토큰 버킷 용량)
+    websocket_stocks: int = int(os.getenv("WEBSOCKET_STOCKS", "40"))  # 실시간(WebSocket) 구독 종목 수 (최대 41, 나머지는 폴링)
     
     # ========================================
     # 분봉 전략 실행 설정 (Minute Strategy Settings)
@@ -318,6 +324,13 @@ class MACrossoverConfig:
     KOSPI200_STOCKS: dict = None  # KOSPI 200 주요 종목
     
     def __post_init__(self):
+        # 호출 속도 미지정 시 기존 API_DELAY 간격과 같은 속도로 제한
+        # (모의투자 계정은 초당 허용 호출 수가 훨씬 적으므로 기본값은 보수적으로 유지)
+        # 직접 지정해도 KIS 실전 계정 한도(초당 20회)를 넘지 않도록 제한
+        if self.api_rate_limit <= 0:
+            self.api_rate_limit = 1.0 / max(self.api_delay, 0.05)
+        self.api_rate_limit = min(self.api_rate_limit, 20.0)
+        
         # ========================================
         # 화장품 관련 종목 (Cosmetics Stocks)
         # ========================================
@@ -616,6 +629,8 @@ class DualMomentumVolatilityConfig:
     # 분석 설정 (Analysis Settings)
     # ========================================
     analysis_interval: int = int(os.getenv("DMV_ANALYSIS_INTERVAL", "60"))  # 분석 주기 (초)
+    fetch_workers: int = int(os.getenv("DMV_FETCH_WORKERS", "8"))  # 시세 동시 조회 스레드 수 (API 호출 제한 고려)
+    cache_dir: str = os.getenv("DMV_CACHE_DIR", "~/.cache/dmv")  # 당일 종목 선별 결과 캐시 경로
     
     def __post_init__(self):
         """설정 검증"""
@@ -0,0 +1,167 @@
+"""
+indicators.py - 기술적 지표 계산 커널
+Technical Indicator Kernels
+
+전략 핫패스에서 반복 호출되는 지표를 NumPy 배열 기반 단일 루프로 계산합니다.
+numba가 설치되어 있으면 JIT 컴파일되고, 없으면 동일한 코드가 순수 파이썬으로 실행됩니다.
+
+Indicators called repeatedly on strategy hot paths, computed in a single loop over NumPy arrays.
+JIT-compiled with numba when available, otherwise the same code runs as plain Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, types
+    
+    # RSI 커널 시그니처 (C 연속 float32/float64 배열, 기간)
+    # pandas의 to_numpy(copy=False)가 돌려주는 읽기 전용 뷰도 복사 없이 받도록 함께 등록
+    _RSI_SIGNATURES = [
+        types.float64(types.Array(dtype, 1, 'C', readonly=readonly), types.int64)
+        for dtype in (types.float32, types.float64)
+        for readonly in (False, True)
+    ]
+    
+    # 실시간 MA 틱 커널 시그니처 (int32 링 버퍼, int64 상태 배열, 가격, 단기 기간, 괴리 비율)
+    _MA_TICK_SIGNATURES = [
+        types.Tuple((types.int64, types.float64, types.float64))(
+            types.Array(types.int32, 1, 'C'), types.Array(types.int64, 1, 'C'),
+            types.int64, types.int64, types.float64
+        )
+    ]
+except ImportError:
+    _RSI_SIGNATURES = None
+    _MA_TICK_SIGNATURES = None
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 그대로 통과시키는 대체 구현"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
+
+
+# 실시간 MA 준비 상태 (ma_tick_update 상태 배열의 state 값)
+MA_WARMUP = 0        # 단기 MA 계산 불가
+MA_SHORT_READY = 1   # 단기 MA만 계산 가능
+MA_FULL = 2          # 단기/장기 MA 모두 계산 가능 → 신호 판단
+
+# ma_tick_update 상태 배열 인덱스
+RING_HEAD = 0        # 다음에 기록할 위치
+RING_COUNT = 1       # 채워진 개수 (최대 long_ma)
+RING_STATE = 2       # MA 준비 상태
+RING_SHORT_SUM = 3   # 단기 윈도우 합계
+RING_LONG_SUM = 4    # 장기 윈도우 합계
+RING_SIZE = 5
+
+
+# 시그니처를 명시해 import 시점에 컴파일 (첫 틱에서 JIT 지연이 생기지 않도록 함)
+@njit(_RSI_SIGNATURES, cache=True)
+def rsi_last(prices, period):
+    """
+    마지막 봉 기준 RSI (Wilder 평활)
+    
+    첫 period개 가격 변화의 단순 평균으로 시작해
+    avg = (avg * (period - 1) + x) / period 로 갱신하는 표준 Wilder RSI입니다.
+    전체 구간을 한 번만 순회하며 (O(n)), 평균 상승/하락분만 유지합니다.
+    
+    Args:
+        prices: 종가 배열 (C 연속 float32 또는 float64, 평균은 float64로 누적)
+        period: RSI 기간
+    
+    Returns:
+        float: RSI 값 (데이터 부족 시 NaN)
+    """
+    n = prices.shape[0]
+    if n <= period:
+        return np.nan
+    
+    # 초기값: 첫 period개 변화의 단순 평균
+    # 분기 없이 상승/하락분 분리: 0.5*(d+|d|) = max(d, 0), 0.5*(|d|-d) = max(-d, 0)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = prices[i] - prices[i - 1]
+        abs_delta = abs(delta)
+        avg_gain += 0.5 * (delta + abs_delta)
+        avg_loss += 0.5 * (abs_delta - delta)
+    avg_gain /= period
+    avg_loss /= period
+    
+    # Wilder 평활
+    for i in range(period + 1, n):
+        delta = prices[i] - prices[i - 1]
+        abs_delta = abs(delta)
+        avg_gain = (avg_gain * (period - 1) + 0.5 * (delta + abs_delta)) / period
+        avg_loss = (avg_loss * (period - 1) + 0.5 * (abs_delta - delta)) / period
+    
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else np.nan
+    
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(_MA_TICK_SIGNATURES, cache=True)
+def ma_tick_update(buf, ring, price, short_ma, gap_frac):
+    """
+    실시간 틱 1개를 MA 링 버퍼에 반영하고 크로스 신호 판단
+    
+    윈도우에서 빠지는 가격을 합계에서 빼고 새 가격을 더해 O(1)로 갱신합니다.
+    장기 윈도우 길이는 buf 길이(long_ma)이며, 상태는 ring에 제자리 기록됩니다.
+    
+    Args:
+        buf: 가격 링 버퍼 (int32, 길이 long_ma)
+        ring: 상태 배열 (int64, RING_* 인덱스 참조)
+        price: 새 체결가
+        short_ma: 단기 MA 기간
+        gap_frac: 매수 MA 괴리 기준 (비율, 0 이상)
+    
+    Returns:
+        tuple: (신호, 단기 MA, 장기 MA)
+            신호 1 = 단기 MA가 장기 MA보다 기준 이상 위, -1 = 단기 MA가 아래, 0 = 관망/준비 중
+            준비되지 않은 MA는 0.0
+    """
+    long_ma = buf.shape[0]
+    head = ring[RING_HEAD]
+    state = ring[RING_STATE]
+    
+    if state == MA_FULL:
+        ring[RING_SHORT_SUM] -= buf[head - short_ma]  # 음수 인덱스 = 링 버퍼 순환
+        ring[RING_LONG_SUM] -= buf[head]
+    else:
+        # 워밍업 중에만 개수를 세고 상태 전이
+        if state == MA_SHORT_READY:
+            ring[RING_SHORT_SUM] -= buf[head - short_ma]
+        count = ring[RING_COUNT] + 1
+        ring[RING_COUNT] = count
+        if count >= long_ma:
+            state = MA_FULL
+        elif count >= short_ma:
+            state = MA_SHORT_READY
+        ring[RING_STATE] = state
+    
+    buf[head] = price
+    head += 1
+    if head == long_ma:  # 나머지 연산 대신 끝에서만 0으로 되돌림
+        head = 0
+    ring[RING_HEAD] = head
+    ring[RING_SHORT_SUM] += price
+    ring[RING_LONG_SUM] += price
+    
+    if state == MA_FULL:
+        ma_short = ring[RING_SHORT_SUM] / short_ma
+        ma_long = ring[RING_LONG_SUM] / long_ma
+        delta = ma_short - ma_long
+        if delta > ma_long * gap_frac:
+            return 1, ma_short, ma_long
+        if delta < 0.0:
+            return -1, ma_short, ma_long
+        return 0, ma_short, ma_long
+    
+    if state == MA_SHORT_READY:
+        return 0, ring[RING_SHORT_SUM] / short_ma, 0.0
+    
+    return 0, 0.0, 0.0
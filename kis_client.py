@@ -10,6 +10,7 @@ Provides authentication, token management, REST API, and WebSocket features.
 """
 
 import logging
+from concurrent.futures import as_completed
 from typing import Optional, Callable, List
 from datetime import datetime
 from pathlib import Path
@@ -183,7 +184,7 @@ class KISClient:
     # 주문 메서드 (Order Methods)
     # ========================================
     
-    def buy_market_order(self, symbol: str, quantity: int) -> Optional[KisOrder]:
+    def buy_market_order(self, symbol: str, quantity: int, stock=None) -> Optional[KisOrder]:
         """
         시장가 매수 주문을 실행합니다.
         Execute market buy order.
@@ -191,6 +192,8 @@ class KISClient:
         Args:
             symbol: 종목 코드 (Stock code)
             quantity: 주문 수량 (Order quantity)
+            stock: 미리 조회해 둔 kis.stock(symbol) 객체 (없으면 새로 조회)
+                   Cached kis.stock(symbol) handle (looked up when omitted)
         
         Returns:
             KisOrder: 주문 결과 또는 None
@@ -199,7 +202,8 @@ class KISClient:
             return None
         
         try:
-            stock = self.kis.stock(symbol)
+            if stock is None:
+                stock = self.kis.stock(symbol)
             
             # 시장가 매수 주문
             # Market buy order
@@ -248,7 +252,7 @@ class KISClient:
             logger.error(f"❌ 매수 주문 실패 ({symbol}, {quantity}주, {price:,}원): {e}")
             return None
     
-    def sell_market_order(self, symbol: str, quantity: int) -> Optional[KisOrder]:
+    def sell_market_order(self, symbol: str, quantity: int, stock=None) -> Optional[KisOrder]:
         """
         시장가 매도 주문을 실행합니다.
         Execute market sell order.
@@ -256,6 +260,8 @@ class KISClient:
         Args:
             symbol: 종목 코드 (Stock code)
             quantity: 주문 수량 (Order quantity)
+            stock: 미리 조회해 둔 kis.stock(symbol) 객체 (없으면 새로 조회)
+                   Cached kis.stock(symbol) handle (looked up when omitted)
         
         Returns:
             KisOrder: 주문 결과 또는 None
@@ -264,7 +270,8 @@ class KISClient:
             return None
         
         try:
-            stock = self.kis.stock(symbol)
+            if stock is None:
+                stock = self.kis.stock(symbol)
             
             # 시장가 매도 주문
             # Market sell order
@@ -533,6 +540,39 @@ class KISClient:
                     logger.error(f"분봉 DataFrame 조회 실패 ({symbol}): {e}")
                     return None
     
+    def get_minute_chart_df_batch(self, symbols: List[str], period: int = 1, executor=None,
+                                  throttle: Optional[Callable[[], None]] = None):
+        """
+        여러 종목의 분봉 데이터를 한 번에 조회합니다.
+        Get minute chart data for several symbols at once.
+        
+        KIS Open API에는 여러 종목 분봉을 한 번에 주는 엔드포인트가 없어
+        종목별 조회를 executor로 동시에 실행하고 끝나는 순서대로 돌려줍니다
+        (executor가 없으면 순차 실행).
+        KIS Open API has no multi-symbol chart endpoint, so per-symbol requests
+        are fanned out over the executor and yielded as they complete
+        (sequential when omitted).
+        
+        Args:
+            symbols: 종목 코드 리스트 (List of stock codes)
+            period: 분봉 주기 (1, 3, 5, 10, 15, 30, 60분)
+            executor: concurrent.futures Executor (선택)
+            throttle: 각 요청 직전에 호출할 함수 (호출 속도 제한용, 선택)
+        
+        Returns:
+            Iterator[tuple]: 조회 완료 순서대로 (종목 코드, 분봉 DataFrame 또는 None)
+        """
+        def fetch(symbol):
+            if throttle is not None:
+                throttle()
+            return symbol, self.get_minute_chart_df(symbol, period=period)
+        
+        if executor is None:
+            return map(fetch, symbols)
+        
+        futures = [executor.submit(fetch, symbol) for symbol in symbols]
+        return (future.result() for future in as_completed(futures))
+    
     # ========================================
     # 내부 헬퍼 메서드 (Internal Helper Methods)
     # ========================================
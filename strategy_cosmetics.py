@@ -14,6 +14,7 @@ import logging
 import time
 import json
 import os
+from collections import deque
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
@@ -76,6 +77,23 @@ class Trade:
     pnl_pct: float = 0.0  # 매도 시 수익률
 
 
+# 거래 기록 버퍼 dtype (Trade 필드와 동일한 순서의 구조화 배열)
+TRADE_DTYPE = np.dtype([
+    ('symbol', 'U7'),
+    ('name', 'U32'),
+    ('trade_type', 'U4'),
+    ('date', 'datetime64[ns]'),
+    ('price', 'f8'),
+    ('quantity', 'i8'),
+    ('value', 'f8'),
+    ('commission', 'f8'),
+    ('tax', 'f8'),
+    ('reason', 'U16'),
+    ('pnl', 'f8'),
+    ('pnl_pct', 'f8'),
+])
+
+
 @dataclass
 class BacktestResult:
     """백테스트 결과"""
@@ -157,15 +175,27 @@ class CosmeticsTrendStrategy:
         self.long_ma_period = self.config.long_ma_period
         self.trailing_stop_pct = self.config.trailing_stop_pct
         
+        # 거래 비용 배수 (매 거래마다 /100 재계산 방지)
+        self._commission_mul = self.config.commission_rate / 100
+        self._tax_mul = self.config.tax_rate / 100
+        self._buy_cost_mul = 1 + (self.config.commission_rate + self.config.slippage) / 100
+        self._sell_mul = 1 - (self.config.commission_rate + self.config.tax_rate + self.config.slippage) / 100
+        
         # 포지션 관리
         self.positions: Dict[str, Position] = {}
         
-        # 거래 기록
+        # 거래 기록 (백테스트 중에는 구조화 배열 버퍼에 기록, 종료 시 Trade 리스트로 변환)
         self.trades: List[Trade] = []
+        self._trade_buf = np.empty(256, dtype=TRADE_DTYPE)
+        self._n_trades = 0
+        self._log_trades = False  # backtest() 시작 시 평가
         
         # 현재 자본
         self.capital = self.config.initial_capital
         
+        # 실시간 신호용 종목별 SMA 롤링 합 캐시
+        self._sma_cache: Dict[str, dict] = {}
+        
         logger.info(f"화장품 추세추종 전략 초기화")
         logger.info(f"  MA: {self.short_ma_period}/{self.long_ma_period}일")
         logger.info(f"  트레일링 스탑: {self.trailing_stop_pct}%")
@@ -232,15 +262,19 @@ class CosmeticsTrendStrategy:
         self.capital = self.config.initial_capital
         self.positions = {}
         self.trades = []
+        self._n_trades = 0
         
-        # 모든 종목의 날짜 범위 통합
-        all_dates = set()
-        for df in price_data.values():
-            all_dates.update(df.index.tolist())
+        # 거래 로그 여부 (설정 + DEBUG 레벨 확인을 거래마다 하지 않도록 한 번만 평가)
+        self._log_trades = backtest_config.log_trades and logger.isEnabledFor(logging.DEBUG)
         
-        trading_dates = sorted(all_dates)
+        # 모든 종목의 날짜 범위 통합 (datetime64 배열을 이어 붙여 한 번에 정렬/중복 제거)
+        if price_data:
+            all_dates = np.concatenate([df.index.values for df in price_data.values()])
+            trading_dates = pd.DatetimeIndex(np.unique(all_dates))
+        else:
+            trading_dates = pd.DatetimeIndex([])
         
-        if not trading_dates:
+        if len(trading_dates) == 0:
             logger.error("거래 데이터가 없습니다.")
             return None
         
@@ -259,26 +293,46 @@ class CosmeticsTrendStrategy:
         
         logger.info(f"  신호 계산 완료: {len(signals_data)}개 종목")
         
-        # 자산 곡선 기록
-        equity_curve = []
+        # 일별 루프용 (거래일 x 종목) 배열 추출 (SoA)
+        # 각 종목 날짜를 통합 거래일에 searchsorted로 정렬해 두고, 루프에서는 present[i, sid]만 확인
+        # 종가는 원 단위 정수라 float32로 손실 없이 표현됨 (자본금 계산은 float64 유지)
+        symbols = list(signals_data.keys())
+        symbol_ids = {symbol: sid for sid, symbol in enumerate(symbols)}
+        n_days = len(trading_dates)
+        n_symbols = len(symbols)
+        
+        present = np.zeros((n_days, n_symbols), dtype=bool)
+        close_mat = np.zeros((n_days, n_symbols), dtype=np.float32)
+        golden_mat = np.zeros((n_days, n_symbols), dtype=bool)
+        death_mat = np.zeros((n_days, n_symbols), dtype=bool)
+        
+        for sid, symbol in enumerate(symbols):
+            df = signals_data[symbol]
+            rows = np.searchsorted(trading_dates.values, df.index.values)
+            present[rows, sid] = True
+            close_mat[rows, sid] = df['close'].to_numpy(dtype=np.float32)
+            golden_mat[rows, sid] = df['golden_cross'].to_numpy(dtype=bool)
+            death_mat[rows, sid] = df['death_cross'].to_numpy(dtype=bool)
+        
+        # 자산 곡선 기록 (거래일 수만큼 미리 할당해 인덱스로 기록)
+        cash_arr = np.empty(n_days)
+        positions_value_arr = np.empty(n_days)
+        total_value_arr = np.empty(n_days)
+        num_positions_arr = np.empty(n_days, dtype=np.int32)
         
         # 일별 시뮬레이션
-        for current_date in trading_dates:
+        for i, current_date in enumerate(trading_dates):
             daily_value = self.capital
             
             # 1. 기존 포지션 평가 및 트레일링 스탑 체크
             positions_to_close = []
             
             for symbol, position in self.positions.items():
-                if symbol not in signals_data:
+                sid = symbol_ids.get(symbol)
+                if sid is None or not present[i, sid]:
                     continue
                 
-                df = signals_data[symbol]
-                if current_date not in df.index:
-                    continue
-                
-                row = df.loc[current_date]
-                current_price = row['close']
+                current_price = float(close_mat[i, sid])
                 
                 # 트레일링 스탑 업데이트
                 if self.config.use_trailing_stop:
@@ -290,7 +344,7 @@ class CosmeticsTrendStrategy:
                         continue
                 
                 # 데스크로스 체크
-                if row.get('death_cross', False):
+                if death_mat[i, sid]:
                     positions_to_close.append((symbol, current_price, "DEATH_CROSS"))
                     continue
                 
@@ -301,49 +355,52 @@ class CosmeticsTrendStrategy:
             for symbol, price, reason in positions_to_close:
                 self._execute_sell(symbol, price, current_date, reason)
             
-            # 3. 매수 신호 체크 (골든크로스)
-            for symbol, df in signals_data.items():
+            # 3. 매수 신호 체크 (골든크로스, 데이터 없는 날은 False로 채워져 있음)
+            for sid in np.flatnonzero(golden_mat[i]):
+                symbol = symbols[sid]
                 if symbol in self.positions:
                     continue
                 
-                if current_date not in df.index:
-                    continue
-                
-                row = df.loc[current_date]
-                
-                if row.get('golden_cross', False):
-                    current_price = row['close']
-                    self._execute_buy(symbol, current_price, current_date)
+                current_price = float(close_mat[i, sid])
+                self._execute_buy(symbol, current_price, current_date)
             
             # 4. 일별 자산 기록
             total_value = self.capital
             for symbol, position in self.positions.items():
-                if symbol in signals_data and current_date in signals_data[symbol].index:
-                    price = signals_data[symbol].loc[current_date, 'close']
-                    total_value += position.quantity * price
+                sid = symbol_ids.get(symbol)
+                if sid is not None and present[i, sid]:
+                    total_value += position.quantity * float(close_mat[i, sid])
             
-            equity_curve.append({
-                'date': current_date,
-                'cash': self.capital,
-                'positions_value': total_value - self.capital,
-                'total_value': total_value,
-                'num_positions': len(self.positions)
-            })
+            cash_arr[i] = self.capital
+            positions_value_arr[i] = total_value - self.capital
+            total_value_arr[i] = total_value
+            num_positions_arr[i] = len(self.positions)
         
         # 마지막 날 모든 포지션 청산
         final_date = trading_dates[-1]
         for symbol in list(self.positions.keys()):
-            if symbol in signals_data and final_date in signals_data[symbol].index:
-                price = signals_data[symbol].loc[final_date, 'close']
+            sid = symbol_ids.get(symbol)
+            if sid is not None and present[-1, sid]:
+                price = float(close_mat[-1, sid])
                 self._execute_sell(symbol, price, final_date, "END_OF_BACKTEST")
         
         # 결과 계산
-        equity_df = pd.DataFrame(equity_curve)
-        equity_df.set_index('date', inplace=True)
+        equity_df = pd.DataFrame(
+            {
+                'cash': cash_arr,
+                'positions_value': positions_value_arr,
+                'total_value': total_value_arr,
+                'num_positions': num_positions_arr
+            },
+            index=trading_dates.rename('date')
+        )
+        
+        trade_records = self._trade_buf[:self._n_trades]
+        self.trades = self._build_trade_list(trade_records)
         
         result = self._calculate_performance(
             equity_df=equity_df,
-            trades=self.trades,
+            trade_records=trade_records,
             start_date=start_date,
             end_date=end_date
         )
@@ -362,9 +419,8 @@ class CosmeticsTrendStrategy:
         
         # 거래 비용 계산
         trade_value = price * quantity
-        commission = trade_value * (self.config.commission_rate / 100)
-        slippage_cost = trade_value * (self.config.slippage / 100)
-        total_cost = trade_value + commission + slippage_cost
+        commission = trade_value * self._commission_mul
+        total_cost = trade_value * self._buy_cost_mul
         
         if total_cost > self.capital:
             return False
@@ -384,21 +440,12 @@ class CosmeticsTrendStrategy:
         self.capital -= total_cost
         
         # 거래 기록
-        trade = Trade(
-            symbol=symbol,
-            name=name,
-            trade_type="BUY",
-            date=trade_date,
-            price=price,
-            quantity=quantity,
-            value=trade_value,
-            commission=commission,
-            tax=0,
-            reason="GOLDEN_CROSS"
+        self._record_trade(
+            symbol, name, "BUY", trade_date, price, quantity,
+            trade_value, commission, 0, "GOLDEN_CROSS"
         )
-        self.trades.append(trade)
         
-        if backtest_config.log_trades:
+        if self._log_trades:
             logger.debug(f"  📈 매수: {name}({symbol}) {quantity}주 @ {price:,.0f}원")
         
         return True
@@ -412,10 +459,9 @@ class CosmeticsTrendStrategy:
         
         # 거래 비용 계산
         trade_value = price * position.quantity
-        commission = trade_value * (self.config.commission_rate / 100)
-        tax = trade_value * (self.config.tax_rate / 100)
-        slippage_cost = trade_value * (self.config.slippage / 100)
-        net_proceeds = trade_value - commission - tax - slippage_cost
+        commission = trade_value * self._commission_mul
+        tax = trade_value * self._tax_mul
+        net_proceeds = trade_value * self._sell_mul
         
         # 손익 계산
         entry_value = position.entry_price * position.quantity
@@ -426,23 +472,12 @@ class CosmeticsTrendStrategy:
         self.capital += net_proceeds
         
         # 거래 기록
-        trade = Trade(
-            symbol=symbol,
-            name=position.name,
-            trade_type="SELL",
-            date=trade_date,
-            price=price,
-            quantity=position.quantity,
-            value=trade_value,
-            commission=commission,
-            tax=tax,
-            reason=reason,
-            pnl=pnl,
-            pnl_pct=pnl_pct
+        self._record_trade(
+            symbol, position.name, "SELL", trade_date, price, position.quantity,
+            trade_value, commission, tax, reason, pnl, pnl_pct
         )
-        self.trades.append(trade)
         
-        if backtest_config.log_trades:
+        if self._log_trades:
             emoji = "📈" if pnl > 0 else "📉"
             logger.debug(f"  {emoji} 매도: {position.name}({symbol}) @ {price:,.0f}원 | {pnl_pct:+.2f}% ({reason})")
         
@@ -451,10 +486,57 @@ class CosmeticsTrendStrategy:
         
         return True
     
+    def _record_trade(
+        self,
+        symbol: str,
+        name: str,
+        trade_type: str,
+        trade_date: date,
+        price: float,
+        quantity: int,
+        value: float,
+        commission: float,
+        tax: float,
+        reason: str,
+        pnl: float = 0.0,
+        pnl_pct: float = 0.0
+    ):
+        """거래 기록 버퍼에 1건 추가 (가득 차면 2배로 확장)"""
+        if self._n_trades == len(self._trade_buf):
+            grown = np.empty(len(self._trade_buf) * 2, dtype=TRADE_DTYPE)
+            grown[:self._n_trades] = self._trade_buf
+            self._trade_buf = grown
+        
+        self._trade_buf[self._n_trades] = (
+            symbol, name, trade_type, trade_date, price, quantity,
+            value, commission, tax, reason, pnl, pnl_pct
+        )
+        self._n_trades += 1
+    
+    def _build_trade_list(self, trade_records: np.ndarray) -> List[Trade]:
+        """거래 기록 버퍼를 Trade 리스트로 변환 (결과 저장/출력용)"""
+        return [
+            Trade(
+                symbol=str(r['symbol']),
+                name=str(r['name']),
+                trade_type=str(r['trade_type']),
+                date=pd.Timestamp(r['date']),
+                price=float(r['price']),
+                quantity=int(r['quantity']),
+                value=float(r['value']),
+                commission=float(r['commission']),
+                tax=float(r['tax']),
+                reason=str(r['reason']),
+                pnl=float(r['pnl']),
+                pnl_pct=float(r['pnl_pct'])
+            )
+            for r in trade_records
+        ]
+    
     def _calculate_performance(
         self,
         equity_df: pd.DataFrame,
-        trades: List[Trade],
+        trade_records: np.ndarray,
         start_date: date,
         end_date: date
     ) -> BacktestResult:
@@ -481,11 +563,13 @@ class CosmeticsTrendStrategy:
         equity_df['drawdown'] = (equity_df['total_value'] - equity_df['peak']) / equity_df['peak'] * 100
         max_drawdown = equity_df['drawdown'].min()
         
-        # MDD 지속 기간
-        drawdown_periods = (equity_df['drawdown'] < 0).astype(int)
-        if drawdown_periods.sum() > 0:
-            drawdown_groups = drawdown_periods.diff().fillna(0).abs().cumsum()
-            max_drawdown_duration = drawdown_periods.groupby(drawdown_groups).sum().max()
+        # MDD 지속 기간 (낙폭 구간의 run-length: 시작/종료 경계 인덱스 차)
+        drawdown_periods = (equity_df['drawdown'].to_numpy() < 0).astype(np.int8)
+        if drawdown_periods.any():
+            change = np.diff(drawdown_periods, prepend=0, append=0)
+            run_starts = np.flatnonzero(change == 1)
+            run_ends = np.flatnonzero(change == -1)
+            max_drawdown_duration = int((run_ends - run_starts).max())
         else:
             max_drawdown_duration = 0
         
@@ -505,49 +589,54 @@ class CosmeticsTrendStrategy:
         else:
             sortino_ratio = 0
         
-        # 거래 통계
-        sell_trades = [t for t in trades if t.trade_type == "SELL"]
+        # 거래 통계 (매도 기록의 pnl/pnl_pct 컬럼으로 벡터 연산)
+        sell_trades = trade_records[trade_records['trade_type'] == "SELL"]
         total_trades = len(sell_trades)
         
-        winning_trades = [t for t in sell_trades if t.pnl > 0]
-        losing_trades = [t for t in sell_trades if t.pnl <= 0]
+        pnl_arr = sell_trades['pnl']
+        pnl_pct_arr = sell_trades['pnl_pct']
+        win_mask = pnl_arr > 0
+        winning_trades = int(win_mask.sum())
+        losing_trades = total_trades - winning_trades
         
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
-        avg_win = np.mean([t.pnl_pct for t in winning_trades]) if winning_trades else 0
-        avg_loss = np.mean([t.pnl_pct for t in losing_trades]) if losing_trades else 0
+        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+        avg_win = pnl_pct_arr[win_mask].mean() if winning_trades else 0
+        avg_loss = pnl_pct_arr[~win_mask].mean() if losing_trades else 0
         
-        total_wins = sum([t.pnl for t in winning_trades]) if winning_trades else 0
-        total_losses = abs(sum([t.pnl for t in losing_trades])) if losing_trades else 1
+        total_wins = pnl_arr[win_mask].sum() if winning_trades else 0
+        total_losses = abs(pnl_arr[~win_mask].sum()) if losing_trades else 1
         profit_factor = total_wins / total_losses if total_losses > 0 else 0
         
         # 월별 수익률
+        # (YYYYMM 정수 임시 키로 그룹핑, "YYYY-MM" 문자열은 결과 dict에 넣을 때만 생성)
+        # equity_curve로 반환/저장되는 'month'/'year' 열은 기존 문자열 형식 유지 (벡터 연산으로 한 번에 생성)
         monthly_returns = {}
         if len(equity_df) > 0:
-            equity_df['month'] = equity_df.index.to_series().apply(lambda x: x.strftime('%Y-%m') if hasattr(x, 'strftime') else str(x)[:7])
-            for month, group in equity_df.groupby('month'):
+            equity_df['month'] = equity_df.index.strftime('%Y-%m')
+            for month, group in equity_df.groupby(equity_df.index.year * 100 + equity_df.index.month):
                 if len(group) > 0:
                     month_return = (group['total_value'].iloc[-1] / group['total_value'].iloc[0] - 1) * 100
-                    monthly_returns[month] = month_return
+                    monthly_returns[f"{month // 100}-{month % 100:02d}"] = month_return
         
         # 연도별 수익률
         yearly_returns = {}
         if len(equity_df) > 0:
-            equity_df['year'] = equity_df.index.to_series().apply(lambda x: str(x)[:4])
-            for year, group in equity_df.groupby('year'):
+            equity_df['year'] = equity_df.index.year.astype(str)
+            for year, group in equity_df.groupby(equity_df.index.year):
                 if len(group) > 0:
                     year_return = (group['total_value'].iloc[-1] / group['total_value'].iloc[0] - 1) * 100
-                    yearly_returns[year] = year_return
+                    yearly_returns[str(year)] = year_return
         
         # 종목별 성과
         stock_performance = {}
-        for symbol in set([t.symbol for t in sell_trades]):
-            symbol_trades = [t for t in sell_trades if t.symbol == symbol]
-            stock_performance[symbol] = {
-                'name': symbol_trades[0].name if symbol_trades else symbol,
+        for symbol in np.unique(sell_trades['symbol']):
+            symbol_trades = sell_trades[sell_trades['symbol'] == symbol]
+            stock_performance[str(symbol)] = {
+                'name': str(symbol_trades['name'][0]),
                 'trades': len(symbol_trades),
-                'total_pnl': sum([t.pnl for t in symbol_trades]),
-                'avg_pnl_pct': np.mean([t.pnl_pct for t in symbol_trades]),
-                'win_rate': len([t for t in symbol_trades if t.pnl > 0]) / len(symbol_trades) * 100 if symbol_trades else 0
+                'total_pnl': symbol_trades['pnl'].sum(),
+                'avg_pnl_pct': symbol_trades['pnl_pct'].mean(),
+                'win_rate': (symbol_trades['pnl'] > 0).sum() / len(symbol_trades) * 100
             }
         
         result = BacktestResult(
@@ -562,8 +651,8 @@ class CosmeticsTrendStrategy:
             sharpe_ratio=sharpe_ratio,
             sortino_ratio=sortino_ratio,
             total_trades=total_trades,
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
             win_rate=win_rate,
             avg_win=avg_win,
             avg_loss=avg_loss,
@@ -571,7 +660,7 @@ class CosmeticsTrendStrategy:
             monthly_returns=monthly_returns,
             yearly_returns=yearly_returns,
             stock_performance=stock_performance,
-            trades=trades,
+            trades=self.trades,
             equity_curve=equity_df
         )
         
@@ -581,12 +670,86 @@ class CosmeticsTrendStrategy:
     # 현재 신호 생성 (실시간 거래용)
     # ========================================
     
-    def generate_current_signals(self, price_data: Dict[str, pd.DataFrame]) -> List[Signal]:
+    def _push_sma_bar(self, cache: dict, close: float):
+        """SMA 캐시에 종가 1개 반영 (윈도우가 가득 차 있으면 가장 오래된 값을 빼고 더함)"""
+        window_short = cache['window_short']
+        window_long = cache['window_long']
+        
+        if len(window_short) == window_short.maxlen:
+            cache['sum_short'] -= window_short[0]
+        if len(window_long) == window_long.maxlen:
+            cache['sum_long'] -= window_long[0]
+        
+        window_short.append(close)
+        window_long.append(close)
+        cache['sum_short'] += close
+        cache['sum_long'] += close
+        
+        cache['ma_diff_prev'] = cache['ma_diff']
+        if len(window_short) == window_short.maxlen and len(window_long) == window_long.maxlen:
+            cache['short_ma'] = cache['sum_short'] / self.short_ma_period
+            cache['long_ma'] = cache['sum_long'] / self.long_ma_period
+            cache['ma_diff'] = cache['short_ma'] - cache['long_ma']
+        else:
+            cache['short_ma'] = np.nan
+            cache['long_ma'] = np.nan
+            cache['ma_diff'] = np.nan
+    
+    def _pop_sma_bar(self, cache: dict):
+        """SMA 캐시에 마지막으로 반영한 종가 1개를 되돌림 (같은 봉을 새 종가로 다시 반영하기 전)"""
+        close = cache['window_short'].pop()
+        cache['window_long'].pop()
+        cache['sum_short'] -= close
+        cache['sum_long'] -= close
+        
+        # 되돌린 봉 직전의 MA 차이로 복원 → 다시 반영하면 ma_diff_prev가 올바르게 설정됨
+        cache['ma_diff'] = cache['ma_diff_prev']
+        cache['ma_diff_prev'] = np.nan
+    
+    def _update_sma_cache(self, symbol: str, df: pd.DataFrame) -> dict:
+        """
+        종목별 SMA 캐시 갱신 (실시간 거래용)
+        
+        마지막으로 반영한 날짜의 봉부터 다시 반영하므로 봉당 O(1).
+        장중(COSMETICS_RUN_TIME)에 반영한 마지막 봉은 아직 형성 중이므로
+        그 봉의 이전 종가를 윈도우/합계에서 빼고 현재 종가로 교체합니다.
+        캐시가 없거나 마지막 반영일이 df에 없으면 최근 구간으로 다시 구성합니다.
+        """
+        closes = df['close'].to_numpy(dtype=np.float64)
+        cache = self._sma_cache.get(symbol)
+        
+        if cache is not None and cache['last_date'] in df.index:
+            start = df.index.get_loc(cache['last_date'])
+            self._pop_sma_bar(cache)
+        else:
+            cache = {
+                'sum_short': 0.0,
+                'sum_long': 0.0,
+                'last_date': None,
+                'window_short': deque(maxlen=self.short_ma_period),
+                'window_long': deque(maxlen=self.long_ma_period),
+                'short_ma': np.nan,
+                'long_ma': np.nan,
+                'ma_diff': np.nan,
+                'ma_diff_prev': np.nan,
+            }
+            self._sma_cache[symbol] = cache
+            # 크로스 판단에는 최근 (장기 MA 기간 + 1)개 봉이면 충분
+            start = max(len(closes) - max(self.short_ma_period, self.long_ma_period) - 1, 0)
+        
+        for close in closes[start:]:
+            self._push_sma_bar(cache, float(close))
+        
+        cache['last_date'] = df.index[-1]
+        return cache
+    
+    def generate_current_signals(self, price_data: Dict[str, pd.DataFrame], incremental: bool = False) -> List[Signal]:
         """
         현재 매매 신호 생성
         
         Args:
             price_data: {종목코드: OHLCV DataFrame} 딕셔너리
+            incremental: True면 종목별 SMA 캐시를 새 봉만큼만 갱신하여 사용
         
         Returns:
             List[Signal]: 현재 매매 신호 리스트
@@ -599,25 +762,38 @@ class CosmeticsTrendStrategy:
                 continue
             
             # 신호 계산
-            df_signals = self.calculate_signals(df)
-            
-            if len(df_signals) == 0:
-                continue
-            
-            latest = df_signals.iloc[-1]
-            prev = df_signals.iloc[-2] if len(df_signals) > 1 else latest
+            if incremental:
+                cache = self._update_sma_cache(symbol, df)
+                
+                price = df['close'].iloc[-1]
+                short_ma = cache['short_ma']
+                long_ma = cache['long_ma']
+                golden_cross = cache['ma_diff'] > 0 and cache['ma_diff_prev'] <= 0
+                death_cross = cache['ma_diff'] < 0 and cache['ma_diff_prev'] >= 0
+                trend_up = cache['ma_diff'] > 0
+            else:
+                df_signals = self.calculate_signals(df)
+                
+                if len(df_signals) == 0:
+                    continue
+                
+                latest = df_signals.iloc[-1]
+                
+                price = latest['close']
+                short_ma = latest['sma_short']
+                long_ma = latest['sma_long']
+                golden_cross = latest['golden_cross']
+                death_cross = latest['death_cross']
+                trend_up = latest['trend'] == 'UP'
             
             name = self.config.get_stock_name(symbol)
-            price = latest['close']
-            short_ma = latest['sma_short']
-            long_ma = latest['sma_long']
             
             # 신호 강도 계산 (MA 갭 비율)
             ma_gap = abs(short_ma - long_ma) / long_ma * 100 if long_ma > 0 else 0
             confidence = min(ma_gap / 5, 1.0)  # 5% 갭이면 confidence = 1
             
             # 신호 판단
-            if latest['golden_cross']:
+            if golden_cross:
                 signal = Signal(
                     symbol=symbol,
                     name=name,
@@ -629,7 +805,7 @@ class CosmeticsTrendStrategy:
                     long_ma=long_ma,
                     confidence=confidence
                 )
-            elif latest['death_cross']:
+            elif death_cross:
                 signal = Signal(
                     symbol=symbol,
                     name=name,
@@ -642,7 +818,7 @@ class CosmeticsTrendStrategy:
                     confidence=confidence
                 )
             else:
-                trend = "상승추세" if latest['trend'] == 'UP' else "하락추세"
+                trend = "상승추세" if trend_up else "하락추세"
                 signal = Signal(
                     symbol=symbol,
                     name=name,
@@ -702,7 +878,7 @@ class CosmeticsTrendStrategy:
         logger.info(f"  데이터 수집 완료: {len(price_data)}개 종목")
         
         # 신호 생성
-        signals = self.generate_current_signals(price_data)
+        signals = self.generate_current_signals(price_data, incremental=True)
         
         # 결과 출력
         buy_signals = [s for s in signals if s.signal_type == "BUY"]
@@ -6,18 +6,45 @@ Dual Momentum + Volatility Breakout Strategy
 Universal short-term momentum strategy for Korean market
 """
 
+import json
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime, time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, date
 import pandas as pd
 import numpy as np
 
 from kis_client import KISClient
-from config import dmv_config
+from config import dmv_config, ma_config
 from strategy import BaseStrategy
+from indicators import rsi_last
 
 logger = logging.getLogger(__name__)
 
+# 할 일이 없는 분석 주기에 반환하는 빈 결과 (매번 dict/list를 새로 만들지 않도록 불변 튜플 사용)
+_EMPTY_RESULTS = {
+    "timestamp": "",
+    "selected_stocks": 0,
+    "entry_signals": (),
+    "exit_signals": (),
+    "orders_placed": (),
+    "errors": ()
+}
+
+
+def _to_hhmmss(hhmm: str) -> int:
+    """'HH:MM' 문자열을 정수 HHMMSS로 변환 (예: '09:30' → 93000)"""
+    t = datetime.strptime(hhmm, "%H:%M")
+    return t.hour * 10000 + t.minute * 100
+
+
+@lru_cache(maxsize=4096)
+def _stock_name(symbol: str) -> str:
+    """종목명 조회 (get_stock_name은 호출마다 전체 종목 사전을 병합하므로 종목별 캐시)"""
+    return ma_config.get_stock_name(symbol)
+
 
 class DualMomentumVolatilityStrategy(BaseStrategy):
     """
@@ -52,6 +79,12 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         
         self.max_positions = dmv_config.max_positions
         self.order_quantity = dmv_config.order_quantity
+        self.fetch_workers = dmv_config.fetch_workers
+        
+        # 거래 시간 설정 (정수 HHMMSS로 미리 변환해 분석마다 정수 비교만 수행)
+        self._entry_start = _to_hhmmss(dmv_config.entry_start_time)
+        self._entry_end = _to_hhmmss(dmv_config.entry_end_time)
+        self._time_exit = _to_hhmmss(dmv_config.time_exit)
         
         # 종목 유니버스 (None이면 장 시작 시 자동 생성)
         self.universe = universe or []
@@ -59,8 +92,31 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         # 선별된 종목 리스트 (매일 갱신)
         self.selected_stocks: Dict[str, str] = {}  # {code: name}
         
-        # 포지션 추적: {symbol: {entry_price, quantity, entry_time, half_sold}}
-        self._positions: Dict[str, Dict] = {}
+        # 선별 종목의 전일 (종가, 고가, 저가) - 장중 변하지 않으므로 선별 시 한 번만 조회
+        self._prev_bars: Dict[str, Tuple[float, float, float]] = {}
+        
+        # selected_stocks/_prev_bars가 속한 거래일 (날짜가 바뀌면 둘 다 폐기 후 재선별)
+        self._selection_date: Optional[date] = None
+        
+        # 포지션 추적 (SoA): 종목별 값을 병렬 배열로 보관해 청산 조건을 한 번에 계산
+        # 행 위치는 _pos_index로 조회하며, 유효 행은 앞쪽 len(_pos_symbols)개
+        capacity = max(self.max_positions, 1)
+        self._pos_symbols: List[str] = []
+        self._pos_names: List[str] = []
+        self._pos_entry_time: List[datetime] = []
+        self._pos_entry = np.empty(capacity, dtype=np.float64)     # 진입가
+        self._pos_qty = np.empty(capacity, dtype=np.int64)         # 보유 수량
+        self._pos_half_sold = np.zeros(capacity, dtype=np.bool_)   # 1차 익절 여부
+        self._pos_index: Dict[str, int] = {}
+        
+        # 분석 1회(run_analysis) 동안 재사용하는 시세 캐시: {(종류, symbol, 인자): DataFrame}
+        # 같은 틱 안에서 청산/진입 체크가 동일 종목을 중복 조회하지 않도록 함
+        self._tick_cache: Dict[tuple, Optional[pd.DataFrame]] = {}
+        
+        # 진입 체크용 분봉 종가/거래량 버퍼 (종목 x 봉, float32) - 매 틱 재사용, 부족할 때만 확장
+        # 행은 오른쪽 정렬로 채워 row[-n:]이 해당 종목의 연속 구간이 되도록 함
+        self._minute_close = np.empty((max(self.max_positions, 8), 64), dtype=np.float32)
+        self._minute_volume = np.empty_like(self._minute_close)
         
         # 일일 손익 추적
         self.daily_pnl = 0.0
@@ -85,6 +141,9 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         logger.info(f"   손절: {self.stop_loss}%")
         logger.info(f"   최대 포지션: {self.max_positions}개")
         logger.info("=" * 60)
+        
+        # 장중 재시작 시 당일 선별 결과 복원 (09:10 이후 재시작해도 거래 지속)
+        self._load_selection_cache()
     
     def on_stop(self):
         """전략 종료"""
@@ -97,8 +156,8 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         logger.info(f"   손절: {self.sl_exits}회")
         logger.info(f"   시간 청산: {self.time_exits}회")
         logger.info(f"   일일 손익: {self.daily_pnl:+.2f}%")
-        if self._positions:
-            logger.info(f"   미청산 포지션: {len(self._positions)}개")
+        if self._pos_symbols:
+            logger.info(f"   미청산 포지션: {len(self._pos_symbols)}개")
         logger.info("=" * 60)
     
     def on_tick(self, tick):
@@ -115,43 +174,136 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         """
         logger.info("\n📊 종목 선별 시작...")
         
+        # 당일 선별 결과가 이미 있으면 재조회 없이 사용
+        if self._load_selection_cache():
+            return self.selected_stocks
+        
         # 간단한 구현: 기존 universe 사용 (실제로는 시총/거래대금 상위 종목 조회 필요)
         if not self.universe:
             logger.warning("   ⚠️ 유니버스가 비어있습니다. 기본 종목 사용")
             # 기본 대형주 사용
-            from config import ma_config
             self.universe = list(ma_config.TECH_GIANTS.keys())
         
-        selected = {}
+        # 종목별 최근 종가를 (종목 수 x 기간) 배열 하나에 모아 모멘텀/MA를 한 번에 계산
+        window = max(self.momentum_period, self.ma_period)
+        closes = np.empty((len(self.universe), window), dtype=np.float64)
+        symbols = []
+        prev_bars = []
         
-        for symbol in self.universe:
-            try:
-                # 일봉 데이터 조회
-                df = self.client.get_daily_prices_df(symbol, count=self.momentum_period + 20)
-                
-                if df is None or len(df) < self.momentum_period:
-                    continue
-                
-                # 상대 모멘텀: N일 수익률
-                momentum_return = ((df['close'].iloc[-1] / df['close'].iloc[-self.momentum_period]) - 1) * 100
-                
-                # 절대 모멘텀: MA 위
-                ma = df['close'].rolling(self.ma_period).mean().iloc[-1]
-                current_price = df['close'].iloc[-1]
-                
-                if current_price > ma and momentum_return > 0:
-                    # 종목명 조회
-                    name = ma_config.get_stock_name(symbol)
-                    selected[symbol] = name
-                    logger.info(f"   ✅ {name}({symbol}): 모멘텀 {momentum_return:.2f}%")
-                
-            except Exception as e:
-                logger.debug(f"   종목 선별 오류 ({symbol}): {e}")
+        # 일봉 데이터 조회 (종목별 REST 호출을 스레드 풀로 동시 실행)
+        daily_dfs = self._fetch_daily_all(self.universe, count=self.momentum_period + 20)
+        
+        for symbol, df in zip(self.universe, daily_dfs):
+            if df is None or len(df) < window:
                 continue
+            
+            close = df['close'].to_numpy(copy=False)
+            closes[len(symbols)] = close[-window:]
+            symbols.append(symbol)
+            prev_bars.append((
+                float(close[-2]),
+                float(df['high'].to_numpy(copy=False)[-2]),
+                float(df['low'].to_numpy(copy=False)[-2]),
+            ))
+        
+        closes = closes[:len(symbols)]
+        current_prices = closes[:, -1]
+        
+        # 상대 모멘텀: N일 수익률
+        momentum_returns = (current_prices / closes[:, -self.momentum_period] - 1) * 100
+        
+        # 절대 모멘텀: MA 위
+        ma = closes[:, -self.ma_period:].mean(axis=1)
+        
+        selected = {}
+        for i in np.flatnonzero((current_prices > ma) & (momentum_returns > 0)):
+            symbol = symbols[i]
+            name = _stock_name(symbol)
+            selected[symbol] = name
+            self._prev_bars[symbol] = prev_bars[i]
+            logger.info(f"   ✅ {name}({symbol}): 모멘텀 {momentum_returns[i]:.2f}%")
         
         logger.info(f"\n   📋 선별 완료: {len(selected)}개 종목")
+        self._save_selection_cache(selected)
+        self._selection_date = datetime.now().date()
         return selected
     
+    def _selection_cache_path(self) -> Path:
+        """당일 종목 선별 캐시 파일 경로 (거래일별 1개)"""
+        return Path(dmv_config.cache_dir).expanduser() / f"dmv_selected_{datetime.now():%Y%m%d}.json"
+    
+    def _load_selection_cache(self) -> bool:
+        """
+        당일 종목 선별 캐시 로드
+        
+        Returns:
+            bool: 캐시를 읽어 selected_stocks/_prev_bars를 복원했으면 True
+        """
+        path = self._selection_cache_path()
+        if not path.exists():
+            return False
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"   ⚠️ 종목 선별 캐시 로드 실패 ({path}): {e}")
+            return False
+        
+        # 다른 거래일의 선별 결과이거나 유니버스가 바뀌었으면 캐시 무시
+        today = datetime.now().date()
+        if data.get("date", today.isoformat()) != today.isoformat():
+            return False
+        if self.universe and data.get("universe") != self.universe:
+            return False
+        
+        self.universe = data["universe"]
+        self.selected_stocks = data["selected"]
+        self._prev_bars = {symbol: tuple(bar) for symbol, bar in data["prev_bars"].items()}
+        self._selection_date = today  # run_analysis가 복원한 결과를 전날 것으로 보고 폐기하지 않도록
+        logger.info(f"   📂 당일 종목 선별 캐시 사용: {len(self.selected_stocks)}개 ({path})")
+        return True
+    
+    def _save_selection_cache(self, selected: Dict[str, str]):
+        """종목 선별 결과를 당일 캐시 파일로 저장"""
+        path = self._selection_cache_path()
+        data = {
+            "date": datetime.now().date().isoformat(),
+            "universe": self.universe,
+            "selected": selected,
+            "prev_bars": {symbol: self._prev_bars[symbol] for symbol in selected},
+        }
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning(f"   ⚠️ 종목 선별 캐시 저장 실패 ({path}): {e}")
+    
+    def _fetch_daily_all(self, symbols: List[str], count: int) -> List[Optional[pd.DataFrame]]:
+        """
+        여러 종목 일봉 동시 조회
+        
+        네트워크 대기 중에는 GIL이 풀리므로 스레드 풀로 호출을 겹쳐
+        전체 소요 시간을 종목 수 x RTT에서 약 RTT 수준으로 줄입니다.
+        
+        Returns:
+            List: symbols 순서대로 DataFrame (조회 실패 시 None)
+        """
+        def fetch(symbol: str) -> Optional[pd.DataFrame]:
+            try:
+                return self.client.get_daily_prices_df(symbol, count=count)
+            except Exception as e:
+                logger.debug("   일봉 조회 오류 (%s): %s", symbol, e)
+                return None
+        
+        if not symbols:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.fetch_workers, len(symbols)))) as executor:
+            return list(executor.map(fetch, symbols))
+    
     def run_analysis(self) -> Dict[str, Any]:
         """
         메인 분석 루프
@@ -161,7 +313,20 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
             Dict: 분석 결과
         """
         now = datetime.now()
-        current_time = now.time()
+        now_hms = now.hour * 10000 + now.minute * 100 + now.second
+        
+        # 1. 일일 손실 제한 체크
+        if self.daily_pnl <= dmv_config.daily_loss_limit:
+            logger.warning(f"⚠️ 일일 손실 제한 도달 ({self.daily_pnl:.2f}%) - 거래 중단")
+            return {**_EMPTY_RESULTS, "timestamp": now.isoformat()}
+        
+        # 보유 포지션이 없고 진입 시간 외면 청산/진입 모두 할 일이 없음
+        if not self._pos_symbols and not (self._entry_start <= now_hms <= self._entry_end):
+            logger.info(f"   ⏸️ 진입 시간 외 ({now.strftime('%H:%M')})")
+            return {**_EMPTY_RESULTS, "timestamp": now.isoformat()}
+        
+        # 이전 틱의 시세는 재사용하지 않음
+        self._tick_cache.clear()
         
         logger.info("\n" + "=" * 60)
         logger.info(f"🔄 듀얼 모멘텀 분석 시작")
@@ -177,60 +342,56 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
             "errors": []
         }
         
-        # 1. 일일 손실 제한 체크
-        if self.daily_pnl <= dmv_config.daily_loss_limit:
-            logger.warning(f"⚠️ 일일 손실 제한 도달 ({self.daily_pnl:.2f}%) - 거래 중단")
-            return results
-        
         # 2. 보유 포지션 청산 조건 체크 (우선)
-        for symbol in list(self._positions.keys()):
-            exit_signal = self._check_exit_conditions(symbol, current_time)
-            if exit_signal:
-                results["exit_signals"].append(exit_signal)
-                order = self._execute_sell(symbol, exit_signal)
-                if order:
-                    results["orders_placed"].append(order)
+        for exit_signal in self._check_exit_batch():
+            results["exit_signals"].append(exit_signal)
+            order = self._execute_sell(exit_signal["symbol"], exit_signal)
+            if order:
+                results["orders_placed"].append(order)
         
         # 3. 시간 청산 체크
-        time_exit = datetime.strptime(dmv_config.time_exit, "%H:%M").time()
-        if current_time >= time_exit:
+        if now_hms >= self._time_exit:
             logger.info(f"⏰ 시간 청산 시간 도달 ({dmv_config.time_exit})")
-            for symbol in list(self._positions.keys()):
-                order = self._execute_sell(symbol, {"reason": "시간 청산", "type": "TIME_EXIT"})
+            # 뒤에서부터 순회: 매도 시 swap-pop으로 마지막 행이 현재 자리로 오므로
+            # 복사본 없이도 모든 포지션을 한 번씩만 처리
+            for i in range(len(self._pos_symbols) - 1, -1, -1):
+                order = self._execute_sell(self._pos_symbols[i], {"reason": "시간 청산", "type": "TIME_EXIT"})
                 if order:
                     results["orders_placed"].append(order)
                     self.time_exits += 1
             return results
         
         # 4. 진입 시간 체크
-        entry_start = datetime.strptime(dmv_config.entry_start_time, "%H:%M").time()
-        entry_end = datetime.strptime(dmv_config.entry_end_time, "%H:%M").time()
-        
-        if not (entry_start <= current_time <= entry_end):
-            logger.info(f"   ⏸️ 진입 시간 외 ({current_time.strftime('%H:%M')})")
+        if not (self._entry_start <= now_hms <= self._entry_end):
+            logger.info(f"   ⏸️ 진입 시간 외 ({now.strftime('%H:%M')})")
             return results
         
         # 5. 최대 포지션 체크
-        if len(self._positions) >= self.max_positions:
+        if len(self._pos_symbols) >= self.max_positions:
             logger.info(f"   📦 최대 포지션 도달 ({self.max_positions}개)")
             return results
         
         # 6. 종목 선별 (매일 1회 - 09:00~09:10 사이)
-        if not self.selected_stocks and time(9, 0) <= current_time <= time(9, 10):
+        # 분석 루프는 여러 거래일에 걸쳐 실행되므로 날짜가 바뀌면 전날 선별 결과와 전일 봉 값을 폐기
+        today = now.date()
+        if self._selection_date != today:
+            self.selected_stocks = {}
+            self._prev_bars = {}
+            self._selection_date = today
+        
+        if not self.selected_stocks and 90000 <= now_hms <= 91000:
             self.selected_stocks = self.select_stocks()
             results["selected_stocks"] = len(self.selected_stocks)
         
-        # 7. 진입 신호 체크
-        for symbol, name in self.selected_stocks.items():
-            if symbol in self._positions:
-                continue  # 이미 보유 중
-            
-            entry_signal = self._check_entry_conditions(symbol, name)
-            if entry_signal:
-                results["entry_signals"].append(entry_signal)
-                order = self._execute_buy(symbol, name, entry_signal)
-                if order:
-                    results["orders_placed"].append(order)
+        # 7. 진입 신호 체크 (이미 보유 중인 종목 제외)
+        candidates = [(symbol, name) for symbol, name in self.selected_stocks.items()
+                      if symbol not in self._pos_index]
+        
+        for entry_signal in self._check_entry_batch(candidates):
+            results["entry_signals"].append(entry_signal)
+            order = self._execute_buy(entry_signal["symbol"], entry_signal["name"], entry_signal, now)
+            if order:
+                results["orders_placed"].append(order)
         
         # 결과 요약
         logger.info("\n" + "=" * 60)
@@ -240,145 +401,301 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         logger.info(f"   진입 신호: {len(results['entry_signals'])}개")
         logger.info(f"   청산 신호: {len(results['exit_signals'])}개")
         logger.info(f"   실행 주문: {len(results['orders_placed'])}개")
-        logger.info(f"   현재 포지션: {len(self._positions)}개")
+        logger.info(f"   현재 포지션: {len(self._pos_symbols)}개")
         logger.info(f"   일일 손익: {self.daily_pnl:+.2f}%")
         logger.info("=" * 60)
         
         return results
     
-    def _check_entry_conditions(self, symbol: str, name: str) -> Optional[Dict]:
+    def _get_daily(self, symbol: str, count: int) -> Optional[pd.DataFrame]:
+        """일봉 조회 (현재 틱 캐시 우선)"""
+        key = ("daily", symbol, count)
+        if key not in self._tick_cache:
+            self._tick_cache[key] = self.client.get_daily_prices_df(symbol, count=count)
+        return self._tick_cache[key]
+    
+    def _get_minute(self, symbol: str, period: int = 1) -> Optional[pd.DataFrame]:
+        """분봉 조회 (현재 틱 캐시 우선)"""
+        key = ("minute", symbol, period)
+        if key not in self._tick_cache:
+            self._tick_cache[key] = self.client.get_minute_chart_df(symbol, period=period)
+        return self._tick_cache[key]
+    
+    def _ensure_minute_arena(self, rows: int, cols: int):
+        """분봉 버퍼가 (rows, cols)보다 작으면 각 축을 2배씩 키워 재할당"""
+        cur_rows, cur_cols = self._minute_close.shape
+        if rows <= cur_rows and cols <= cur_cols:
+            return
+        
+        while cur_rows < rows:
+            cur_rows *= 2
+        while cur_cols < cols:
+            cur_cols *= 2
+        
+        self._minute_close = np.empty((cur_rows, cur_cols), dtype=np.float32)
+        self._minute_volume = np.empty_like(self._minute_close)
+    
+    def _check_entry_batch(self, candidates: List[tuple]) -> List[Dict]:
         """
-        진입 조건 체크: 변동성 돌파
-        Check entry conditions: Volatility breakout
+        진입 조건 일괄 체크: 변동성 돌파
+        Check entry conditions for all candidates at once: Volatility breakout
+        
+        후보 종목 시세를 동시 조회한 뒤 종목별 값을 (종목 수,) 배열로 모아
+        돌파가/거래량 배수/RSI/등락률 조건을 한 번에 계산합니다.
+        
+        Args:
+            candidates: [(symbol, name), ...] 미보유 선별 종목
+        
+        Returns:
+            List[Dict]: 진입 신호 리스트 (candidates 순서)
         """
-        try:
-            # 일봉 데이터 (전일 정보)
-            df_daily = self.client.get_daily_prices_df(symbol, count=30)
-            if df_daily is None or len(df_daily) < 2:
-                return None
-            
-            prev_close = df_daily['close'].iloc[-2]
-            prev_high = df_daily['high'].iloc[-2]
-            prev_low = df_daily['low'].iloc[-2]
-            
-            # 변동성 돌파가 계산
-            breakout_price = prev_close + (prev_high - prev_low) * self.breakout_k
-            
-            # 분봉 데이터 (현재가)
-            df_minute = self.client.get_minute_chart_df(symbol, period=1)
+        def fetch(symbol: str):
+            try:
+                # 전일 값은 선별 시 저장한 것을 우선 사용 (없으면 일봉 조회)
+                prev_bar = self._prev_bars.get(symbol)
+                if prev_bar is None:
+                    df_daily = self._get_daily(symbol, count=30)
+                    if df_daily is None or len(df_daily) < 2:
+                        return None, None
+                    prev_bar = (
+                        df_daily['close'].to_numpy(copy=False)[-2],
+                        df_daily['high'].to_numpy(copy=False)[-2],
+                        df_daily['low'].to_numpy(copy=False)[-2],
+                    )
+                return prev_bar, self._get_minute(symbol)
+            except Exception as e:
+                logger.error(f"   진입 조건 체크 오류 ({symbol}): {e}")
+                return None, None
+        
+        if not candidates:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.fetch_workers, len(candidates)))) as executor:
+            fetched = list(executor.map(fetch, [symbol for symbol, _ in candidates]))
+        
+        # 분봉 버퍼 크기 확보 (이번 틱 후보 수 x 최장 분봉 길이)
+        n_bars = max((len(df) for _, df in fetched if df is not None), default=0)
+        self._ensure_minute_arena(len(candidates), n_bars)
+        
+        # 종목별 스칼라 값 수집: 전일 종가/고가/저가, 현재가/현재 거래량/평균 거래량/RSI
+        daily = np.empty((len(candidates), 3), dtype=np.float64)
+        minute = np.empty((len(candidates), 4), dtype=np.float64)
+        rows = []
+        
+        for (symbol, name), (prev_bar, df_minute) in zip(candidates, fetched):
+            if prev_bar is None:
+                continue
             if df_minute is None or len(df_minute) < 20:
-                return None
-            
-            current_price = df_minute['close'].iloc[-1]
-            current_volume = df_minute['volume'].iloc[-1]
-            avg_volume = df_minute['volume'].rolling(20).mean().iloc[-1]
-            
-            # RSI 계산
-            rsi = self._calculate_rsi(df_minute['close'], self.rsi_period)
-            
-            # 진입 조건 체크
-            if current_price < breakout_price:
-                return None
-            
-            if current_volume < avg_volume * self.volume_multiplier:
-                logger.debug(f"   {name}: 거래량 부족 ({current_volume/avg_volume:.1f}x)")
-                return None
+                continue
             
-            if rsi > self.rsi_max:
-                logger.debug(f"   {name}: RSI 과매수 ({rsi:.1f})")
-                return None
+            try:
+                k = len(rows)
+                daily[k] = prev_bar
+                
+                n = len(df_minute)
+                close = self._minute_close[k, -n:]
+                volume = self._minute_volume[k, -n:]
+                close[:] = df_minute['close'].to_numpy(copy=False)
+                volume[:] = df_minute['volume'].to_numpy(copy=False)
+                minute[k] = (
+                    close[-1],
+                    volume[-1],
+                    volume[-20:].mean(dtype=np.float64),
+                    self._calculate_rsi(close, self.rsi_period),
+                )
+                rows.append((symbol, name))
+            except Exception as e:
+                logger.error(f"   진입 조건 체크 오류 ({symbol}): {e}")
+        
+        prev_close, prev_high, prev_low = daily[:len(rows)].T
+        current_price, current_volume, avg_volume, rsi = minute[:len(rows)].T
+        
+        # 변동성 돌파가 / 거래량 배수
+        breakout_price = prev_close + (prev_high - prev_low) * self.breakout_k
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = current_volume / avg_volume
+        
+        # 진입 조건 체크 (기존 체크 순서대로 누적, 비교 불가(NaN)는 통과)
+        breakout_ok = ~(current_price < breakout_price)
+        volume_ok = breakout_ok & ~(current_volume < avg_volume * self.volume_multiplier)
+        rsi_ok = volume_ok & ~(rsi > self.rsi_max)
+        passed = rsi_ok
+        
+        # 탈락 사유 로그는 DEBUG 레벨일 때만 마스크를 풀어 기록
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            for i in np.flatnonzero(breakout_ok & ~volume_ok):
+                logger.debug("   %s: 거래량 부족 (%.1fx)", rows[i][1], volume_ratio[i])
             
-            # 상한가 임박 체크
-            if dmv_config.avoid_limit_up:
-                change_pct = ((current_price / prev_close) - 1) * 100
-                if change_pct >= dmv_config.limit_up_threshold:
-                    logger.debug(f"   {name}: 상한가 임박 ({change_pct:.1f}%)")
-                    return None
+            for i in np.flatnonzero(volume_ok & ~rsi_ok):
+                logger.debug("   %s: RSI 과매수 (%.1f)", rows[i][1], rsi[i])
+        
+        # 상한가 임박 체크
+        if dmv_config.avoid_limit_up:
+            change_pct = ((current_price / prev_close) - 1) * 100
+            passed = rsi_ok & ~(change_pct >= dmv_config.limit_up_threshold)
+            if debug:
+                for i in np.flatnonzero(rsi_ok & ~passed):
+                    logger.debug("   %s: 상한가 임박 (%.1f%%)", rows[i][1], change_pct[i])
+        
+        signals = []
+        for i in np.flatnonzero(passed):
+            symbol, name = rows[i]
             
             logger.info(f"   🔔 진입 신호: {name}({symbol})")
-            logger.info(f"      현재가: {current_price:,}원")
-            logger.info(f"      돌파가: {breakout_price:,}원")
-            logger.info(f"      거래량: {current_volume/avg_volume:.1f}x")
-            logger.info(f"      RSI: {rsi:.1f}")
+            logger.info(f"      현재가: {current_price[i]:,.0f}원")
+            logger.info(f"      돌파가: {breakout_price[i]:,.0f}원")
+            logger.info(f"      거래량: {volume_ratio[i]:.1f}x")
+            logger.info(f"      RSI: {rsi[i]:.1f}")
             
-            return {
+            signals.append({
                 "symbol": symbol,
                 "name": name,
-                "price": current_price,
-                "breakout_price": breakout_price,
-                "volume_ratio": current_volume / avg_volume,
-                "rsi": rsi
-            }
-            
-        except Exception as e:
-            logger.error(f"   진입 조건 체크 오류 ({symbol}): {e}")
-            return None
+                "price": float(current_price[i]),
+                "breakout_price": float(breakout_price[i]),
+                "volume_ratio": float(volume_ratio[i]),
+                "rsi": float(rsi[i])
+            })
+        
+        return signals
     
-    def _check_exit_conditions(self, symbol: str, current_time: time) -> Optional[Dict]:
+    def _batch_current_prices(self, symbols: List[str]) -> np.ndarray:
         """
-        청산 조건 체크: 익절/손절
-        Check exit conditions: Take profit / Stop loss
+        보유 종목 현재가 동시 조회 (분봉 마지막 종가)
+        
+        Returns:
+            np.ndarray: symbols 순서대로 현재가 (조회 실패 시 NaN)
         """
-        pos = self._positions.get(symbol)
-        if not pos:
-            return None
+        def fetch(symbol: str) -> float:
+            try:
+                df = self._get_minute(symbol)
+                if df is None or df.empty:
+                    return np.nan
+                return float(df['close'].to_numpy(copy=False)[-1])
+            except Exception as e:
+                logger.error(f"   청산 조건 체크 오류 ({symbol}): {e}")
+                return np.nan
         
-        try:
-            # 현재가 조회
-            df = self.client.get_minute_chart_df(symbol, period=1)
-            if df is None or df.empty:
-                return None
-            
-            current_price = df['close'].iloc[-1]
-            entry_price = pos['entry_price']
-            pnl_pct = ((current_price / entry_price) - 1) * 100
+        if not symbols:
+            return np.empty(0, dtype=np.float64)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.fetch_workers, len(symbols)))) as executor:
+            return np.fromiter(executor.map(fetch, symbols), dtype=np.float64, count=len(symbols))
+    
+    def _check_exit_batch(self) -> List[Dict]:
+        """
+        청산 조건 일괄 체크: 익절/손절
+        Check exit conditions for all positions at once: Take profit / Stop loss
+        
+        보유 종목 현재가를 한 번에 조회한 뒤 포지션 배열 전체에 대해
+        수익률을 계산하고 손절 → 2차 익절 → 1차 익절 순으로 마스크를 판정합니다.
+        
+        Returns:
+            List[Dict]: 청산 신호 리스트
+        """
+        n = len(self._pos_symbols)
+        if n == 0:
+            return []
+        
+        symbols = list(self._pos_symbols)
+        quantity = self._pos_qty[:n]
+        
+        # 수익률: 현재가 배열 위에서 제자리 계산 (중간 배열 없이 한 버퍼로 처리)
+        pnl = self._batch_current_prices(symbols)
+        np.divide(pnl, self._pos_entry[:n], out=pnl)
+        pnl -= 1
+        pnl *= 100
+        
+        # 현재가 조회 실패(NaN)는 비교가 모두 False → 청산 신호 없음
+        sl = pnl <= self.stop_loss
+        tp2 = pnl >= self.take_profit_2
+        tp2 &= ~sl
+        tp1 = pnl >= self.take_profit_1
+        tp1 &= ~(sl | tp2 | self._pos_half_sold[:n])
+        
+        signals = []
+        for i in np.flatnonzero(sl | tp2 | tp1):
+            symbol = symbols[i]
+            name = self._pos_names[i]
+            pnl_pct = float(pnl[i])
             
-            # 손절 체크
-            if pnl_pct <= self.stop_loss:
-                logger.info(f"   🛑 손절: {pos['name']}({symbol}) {pnl_pct:.2f}%")
+            # 손절
+            if sl[i]:
+                logger.info(f"   🛑 손절: {name}({symbol}) {pnl_pct:.2f}%")
                 self.sl_exits += 1
-                return {
+                signals.append({
                     "symbol": symbol,
                     "reason": "손절",
                     "type": "STOP_LOSS",
                     "pnl_pct": pnl_pct,
-                    "quantity": pos['quantity']
-                }
+                    "quantity": int(quantity[i])
+                })
             
-            # 2차 익절 체크 (전량)
-            if pnl_pct >= self.take_profit_2:
-                logger.info(f"   🎯 2차 익절: {pos['name']}({symbol}) {pnl_pct:.2f}%")
+            # 2차 익절 (전량)
+            elif tp2[i]:
+                logger.info(f"   🎯 2차 익절: {name}({symbol}) {pnl_pct:.2f}%")
                 self.tp2_exits += 1
-                return {
+                signals.append({
                     "symbol": symbol,
                     "reason": "2차 익절",
                     "type": "TAKE_PROFIT_2",
                     "pnl_pct": pnl_pct,
-                    "quantity": pos['quantity']
-                }
+                    "quantity": int(quantity[i])
+                })
             
-            # 1차 익절 체크 (50% 물량)
-            if pnl_pct >= self.take_profit_1 and not pos.get('half_sold', False):
-                logger.info(f"   🎯 1차 익절: {pos['name']}({symbol}) {pnl_pct:.2f}%")
+            # 1차 익절 (50% 물량)
+            else:
+                logger.info(f"   🎯 1차 익절: {name}({symbol}) {pnl_pct:.2f}%")
                 self.tp1_exits += 1
-                return {
+                signals.append({
                     "symbol": symbol,
                     "reason": "1차 익절",
                     "type": "TAKE_PROFIT_1",
                     "pnl_pct": pnl_pct,
-                    "quantity": pos['quantity'] // 2  # 50% 물량
-                }
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"   청산 조건 체크 오류 ({symbol}): {e}")
-            return None
+                    "quantity": int(quantity[i]) // 2  # 50% 물량
+                })
+        
+        return signals
+    
+    def _add_position(self, symbol: str, name: str, entry_price: float, quantity: int, entry_time: datetime):
+        """포지션 배열 끝에 신규 포지션 추가 (용량 부족 시 2배 확장)"""
+        n = len(self._pos_symbols)
+        if n == len(self._pos_entry):
+            self._pos_entry = np.concatenate([self._pos_entry, np.empty_like(self._pos_entry)])
+            self._pos_qty = np.concatenate([self._pos_qty, np.empty_like(self._pos_qty)])
+            self._pos_half_sold = np.concatenate([self._pos_half_sold, np.empty_like(self._pos_half_sold)])
+        
+        self._pos_entry[n] = entry_price
+        self._pos_qty[n] = quantity
+        self._pos_half_sold[n] = False
+        self._pos_symbols.append(symbol)
+        self._pos_names.append(name)
+        self._pos_entry_time.append(entry_time)
+        self._pos_index[symbol] = n
     
-    def _execute_buy(self, symbol: str, name: str, signal: Dict) -> Optional[Dict]:
-        """매수 주문 실행"""
+    def _remove_position(self, symbol: str):
+        """포지션 삭제 (마지막 행을 빈자리로 옮기는 swap-pop으로 배열을 연속 유지)"""
+        i = self._pos_index.pop(symbol)
+        last = len(self._pos_symbols) - 1
+        
+        if i != last:
+            moved = self._pos_symbols[last]
+            self._pos_symbols[i] = moved
+            self._pos_names[i] = self._pos_names[last]
+            self._pos_entry_time[i] = self._pos_entry_time[last]
+            self._pos_entry[i] = self._pos_entry[last]
+            self._pos_qty[i] = self._pos_qty[last]
+            self._pos_half_sold[i] = self._pos_half_sold[last]
+            self._pos_index[moved] = i
+        
+        self._pos_symbols.pop()
+        self._pos_names.pop()
+        self._pos_entry_time.pop()
+    
+    def _execute_buy(self, symbol: str, name: str, signal: Dict, now: datetime) -> Optional[Dict]:
+        """매수 주문 실행 (now: 현재 분석 시각, 진입 시간으로 기록)"""
         # 이미 보유 중인지 확인
-        if symbol in self._positions:
+        if symbol in self._pos_index:
             return None
         
         # 현재 보유 수량 확인
@@ -393,19 +710,13 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         order = self.client.buy_market_order(symbol, self.order_quantity)
         
         if order:
-            logger.info(f"   💰 매수 주문 실행: {name} {self.order_quantity}주 @ {entry_price:,}원")
+            logger.info(f"   💰 매수 주문 실행: {name} {self.order_quantity}주 @ {entry_price:,.0f}원")
             
             self.total_entries += 1
             self.daily_trades += 1
             
             # 포지션 추적
-            self._positions[symbol] = {
-                "name": name,
-                "entry_price": entry_price,
-                "quantity": self.order_quantity,
-                "entry_time": datetime.now(),
-                "half_sold": False
-            }
+            self._add_position(symbol, name, entry_price, self.order_quantity, now)
             
             return {
                 "type": "BUY",
@@ -420,20 +731,22 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
     
     def _execute_sell(self, symbol: str, signal: Dict) -> Optional[Dict]:
         """매도 주문 실행"""
-        pos = self._positions.get(symbol)
-        if not pos:
+        i = self._pos_index.get(symbol)
+        if i is None:
             return None
         
+        name = self._pos_names[i]
+        
         # 현재 보유 수량 확인
         current_position = self.client.get_position(symbol)
         if current_position == 0:
             logger.info(f"   ℹ️ 보유 수량 없음")
             # 포지션 정리
-            del self._positions[symbol]
+            self._remove_position(symbol)
             return None
         
         # 매도 수량 결정
-        sell_quantity = signal.get('quantity', pos['quantity'])
+        sell_quantity = signal.get('quantity', int(self._pos_qty[i]))
         sell_quantity = min(sell_quantity, current_position)
         
         # 시장가 매도 주문
@@ -441,7 +754,7 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         
         if order:
             pnl_pct = signal.get('pnl_pct', 0.0)
-            logger.info(f"   💸 매도 주문 실행: {pos['name']} {sell_quantity}주")
+            logger.info(f"   💸 매도 주문 실행: {name} {sell_quantity}주")
             logger.info(f"      수익률: {pnl_pct:+.2f}%")
             
             self.total_exits += 1
@@ -449,16 +762,16 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
             
             # 1차 익절인 경우 half_sold 플래그 설정
             if signal.get('type') == 'TAKE_PROFIT_1':
-                pos['half_sold'] = True
-                pos['quantity'] = pos['quantity'] - sell_quantity
+                self._pos_half_sold[i] = True
+                self._pos_qty[i] -= sell_quantity
             else:
                 # 전량 청산 시 포지션 삭제
-                del self._positions[symbol]
+                self._remove_position(symbol)
             
             return {
                 "type": "SELL",
                 "symbol": symbol,
-                "name": pos['name'],
+                "name": name,
                 "quantity": sell_quantity,
                 "pnl_pct": pnl_pct,
                 "reason": signal.get('reason', 'Unknown'),
@@ -467,16 +780,12 @@ class DualMomentumVolatilityStrategy(BaseStrategy):
         
         return None
     
-    def _calculate_rsi(self, prices: pd.Series, period: int) -> float:
-        """RSI 계산"""
-        try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            return rsi.iloc[-1]
-        except:
+    def _calculate_rsi(self, prices: np.ndarray, period: int) -> float:
+        """RSI 계산 (indicators.rsi_last 커널 사용, float32 배열은 변환 없이 전달)"""
+        # 데이터 부족/마지막 값 이상 시 기본값 (예외 처리 대신 사전 검사)
+        if len(prices) < period + 1 or not np.isfinite(prices[-1]):
             return 50.0  # 기본값
+        
+        if prices.dtype != np.float32:
+            prices = np.ascontiguousarray(prices, dtype=np.float64)
+        return float(rsi_last(prices, period))
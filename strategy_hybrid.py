@@ -12,21 +12,46 @@ Remaining 60 stocks: 10-minute candle REST API polling
 import logging
 import time
 import threading
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
+import numpy as np
 from pykis import KisRealtimePrice, KisSubscriptionEventArgs, KisWebsocketClient
 
 from kis_client import KISClient
 from config import ma_config, fee_config
+from indicators import (
+    ma_tick_update, MA_FULL, RING_SIZE, RING_COUNT, RING_STATE, RING_SHORT_SUM, RING_LONG_SUM
+)
 
 logger = logging.getLogger(__name__)
 
+# requests(urllib3) HTTPAdapter 기본 호스트별 연결 풀 크기
+# REST 호출은 KISClient 하나(pykis 내부 Session)를 공유하므로 동시 호출 수가 이 값을 넘으면
+# 반환된 keep-alive 연결이 버려지고 매번 TCP/TLS 연결을 새로 맺게 됨
+_HTTP_POOL_MAXSIZE = 10
 
-@dataclass
+# 실시간 종목 초기화 호출 속도 하한 (초당 호출 수)
+# 기존 순차 초기화: 종목당 현재가 + 분봉 2회 호출 후 0.5초 대기 → 초당 약 4회
+_INIT_CALL_RATE = 4.0
+
+# 초기화/구독 요약 로그에 이름을 나열할 최대 종목 수
+_LOG_PREVIEW_COUNT = 10
+
+
+def _preview_names(names: List[str]) -> str:
+    """요약 로그용 종목 이름 나열 (앞 _LOG_PREVIEW_COUNT개만, 나머지는 '...')"""
+    preview = ", ".join(names[:_LOG_PREVIEW_COUNT])
+    return preview + ", ..." if len(names) > _LOG_PREVIEW_COUNT else preview
+
+
+@dataclass(slots=True)
 class RealtimeStock:
-    """실시간 종목 데이터"""
+    """실시간 종목 데이터 (틱마다 갱신되므로 __slots__로 고정 레이아웃)"""
     symbol: str
     name: str
     price: int = 0
@@ -36,12 +61,61 @@ class RealtimeStock:
     volume: int = 0
     high: int = 0
     low: int = 0
-    last_update: datetime = field(default_factory=datetime.now)
+    last_update_ns: int = field(default_factory=time.monotonic_ns)  # 마지막 체결 시각 (monotonic, ns)
     
-    # MA 계산용 가격 히스토리
-    price_history: List[int] = field(default_factory=list)
+    # MA 계산용 가격 링 버퍼 (길이 long_ma 고정, 재할당 없이 head 위치에 덮어씀)
+    price_buf: np.ndarray = field(default_factory=lambda: np.zeros(ma_config.long_ma_period, dtype=np.int32))
+    # 링 버퍼 상태 [head, count, state, 단기 합계, 장기 합계] (indicators.RING_* 인덱스)
+    # 틱마다 ma_tick_update 커널이 제자리 갱신
+    ring: np.ndarray = field(default_factory=lambda: np.zeros(RING_SIZE, dtype=np.int64))
     ma_short: float = 0.0
     ma_long: float = 0.0
+    
+    @property
+    def last_update(self) -> datetime:
+        """마지막 체결 시각 (벽시계 시간으로 변환, 조회 시에만 계산)"""
+        elapsed_ns = time.monotonic_ns() - self.last_update_ns
+        return datetime.now() - timedelta(microseconds=elapsed_ns // 1000)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 호출 속도 제한기 (스레드 안전)
+    Thread-safe token-bucket rate limiter
+    
+    여러 작업 스레드가 공유하며, 초당 rate_per_sec개까지 호출을 허용합니다.
+    batch_size를 주면 batch_size회 호출마다 batch_delay초를 추가로 대기합니다
+    (기존 순차 배치 처리의 배치 간 대기와 같은 효과).
+    """
+    
+    def __init__(self, rate_per_sec: float, capacity: int = 1, batch_size: int = 0, batch_delay: float = 0.0):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self._batch_debt = batch_delay * rate_per_sec  # 배치 간 대기를 토큰 부채로 환산
+        self._granted = 0
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._granted += 1
+                    if self.batch_size and self._granted % self.batch_size == 0:
+                        self._tokens -= self._batch_debt
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            
+            time.sleep(wait)
 
 
 class HybridStrategy:
@@ -53,7 +127,9 @@ class HybridStrategy:
     - REST API: 나머지 종목 10분봉 폴링
     """
     
-    MAX_WEBSOCKET_STOCKS = 40  # KIS API 제한
+    # KIS API 제한: 앱키(세션)당 실시간 등록 최대 41건
+    # 같은 앱키로 WebSocket을 여러 개 열어도 한도는 늘지 않으므로 연결 풀 대신 한도 내에서 설정값 사용
+    MAX_WEBSOCKET_STOCKS = 41
     
     def __init__(self, client: KISClient, all_stocks: Dict[str, str]):
         """
@@ -64,41 +140,93 @@ class HybridStrategy:
         self.client = client
         self.all_stocks = all_stocks
         
-        # 종목 분류
-        stock_list = list(all_stocks.items())
-        self.realtime_stocks = dict(stock_list[:self.MAX_WEBSOCKET_STOCKS])
-        self.polling_stocks = dict(stock_list[self.MAX_WEBSOCKET_STOCKS:])
+        # 종목 분류 (입력 순서대로 앞 websocket_stocks개는 실시간, 나머지는 폴링 - 한 번만 순회)
+        websocket_stocks = max(0, min(ma_config.websocket_stocks, self.MAX_WEBSOCKET_STOCKS))
+        stock_items = iter(all_stocks.items())
+        self.realtime_stocks = dict(islice(stock_items, websocket_stocks))
+        self.polling_stocks = dict(stock_items)
         
         # 실시간 데이터 저장
         self.realtime_data: Dict[str, RealtimeStock] = {}
+        # 구독 티켓 목록 (메인 스레드 stop()과 모니터 스레드 재연결이 함께 건드리므로 락으로 직렬화)
+        # 구독은 모두 pykis가 PyKis 인스턴스당 하나 유지하는 WebSocket 클라이언트/수신 스레드를 공유
         self._subscriptions = []
+        self._subscriptions_lock = threading.RLock()
+        self._subscriptions_count = 0  # 구독 티켓 수 (get_status가 락 없이 읽음)
+        self._stock_objs: Dict[str, object] = {}  # 구독 시 조회한 kis.stock 객체 (주문에 재사용)
         
         # 전략 설정
         self.short_ma = ma_config.short_ma_period
         self.long_ma = ma_config.long_ma_period
         self.order_quantity = ma_config.order_quantity
         
+        # 매수 MA 괴리 기준을 비율로 미리 계산 (틱마다 나눗셈/×100 없이 비교)
+        # 골든크로스 자체가 단기 MA > 장기 MA 조건이므로 기준은 0 이상으로 제한
+        self._gap_thresh_frac = max(ma_config.min_ma_gap_pct, 0.0) / 100.0
+        
         # 수수료 설정
         self.fee_config = fee_config
         self.min_profit_threshold = fee_config.min_profit_threshold
         self.break_even_rate = fee_config.calculate_break_even_rate()
         
+        # 틱/매도 경로에서 반복 참조하는 설정값 (시작 후 바뀌지 않음 - 모듈 설정 속성 조회 대신 사용)
+        self._stop_loss_pct = ma_config.stop_loss_pct  # 기본값: -1.0%
+        self._use_fee_aware_sell = fee_config.use_fee_aware_sell
+        
         # 포지션 추적
+        # 변경은 _positions_lock 안에서만 하고, 변경 후 보유 종목 스냅샷(frozenset)을 교체
+        # → 틱 경로의 보유 여부 확인은 락 없이 불변 집합만 조회
         self.positions: Dict[str, dict] = {}
+        self._positions_lock = threading.Lock()
+        self._positions_keys: frozenset = frozenset()
+        self._in_flight: set = set()  # 주문 REST 호출이 진행 중인 종목 (_positions_lock으로 보호)
+        self._positions_count = 0  # 보유 종목 수 (get_status가 락 없이 읽음)
         self.orders_placed = 0
         self.fee_saved_count = 0  # 수수료로 인해 매도 스킵한 횟수
         
         # 상태
         self.is_running = False
-        self._polling_thread: Optional[threading.Thread] = None
-        self._monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # stop() 시 set → 대기 중인 스레드 즉시 깨움
+        # 폴링(10분)과 WebSocket 모니터링(30초)은 하나의 백그라운드 스레드에서 시각별로 실행
+        # (폴링은 BATCH_SIZE개씩 나눠 조회하고 조각 사이마다 점검 시각을 확인)
+        self._background_thread: Optional[threading.Thread] = None
+        self._polling_interval_sec: int = 600
+        self._monitor_interval_sec: int = 30
+        self._next_websocket_check: float = 0.0  # 다음 WebSocket 점검 시각 (monotonic)
+        
+        # 실시간 틱 큐 (WebSocket 콜백 → 신호 처리 스레드)
+        # 콜백은 append + set만 하고 MA/신호/주문/로그는 _signal_thread에서 처리
+        # 주문 지연으로 처리가 밀리면 가장 오래된 틱부터 버림
+        self._tick_queue: deque = deque(maxlen=4096)
+        self._tick_event = threading.Event()
+        self._dropped_ticks = 0  # 큐가 가득 차 버려진 틱 수 (콜백 스레드만 증가, get_status로 노출)
+        self._drop_warn_interval_sec: int = 60  # 틱 유실 경고 로그 최소 간격
+        self._signal_thread: Optional[threading.Thread] = None
+        
+        # REST 조회용 스레드 풀 + 호출 속도 제한 (초기화/폴링 공용 풀, 제한기는 각각)
+        # 작업 스레드 수는 연결 풀 크기 이하로 제한해 keep-alive 연결을 계속 재사용
+        # 폴링 속도는 기존 배치 설정(API_DELAY/BATCH_SIZE/BATCH_DELAY)을 따름 (API_RATE_LIMIT로 재정의 가능)
+        # (stop()에서 종료 후 None → 다시 start()하면 새로 생성)
+        self._io_pool: Optional[ThreadPoolExecutor] = self._create_io_pool()
+        self._rate_limiter = TokenBucket(
+            ma_config.api_rate_limit,
+            capacity=max(1, ma_config.api_rate_burst),
+            batch_size=max(0, ma_config.batch_size),
+            batch_delay=max(0.0, ma_config.batch_delay)
+        )
+        # 초기화는 배치 대기 없이 기존 순차 초기화 이상의 속도로 (시작/재연결 지연 최소화)
+        self._init_rate_limiter = TokenBucket(
+            max(ma_config.api_rate_limit, _INIT_CALL_RATE),
+            capacity=max(1, ma_config.api_rate_burst)
+        )
         
         # WebSocket 연결 모니터링
-        self._last_realtime_update: datetime = datetime.now()
+        self._last_realtime_update_ns: int = time.monotonic_ns()  # 마지막 WebSocket 수신 (monotonic, ns)
         self._websocket_timeout_sec: int = 120  # 2분간 데이터 없으면 재연결
         self._reconnect_count: int = 0
         self._max_reconnect_attempts: int = 10  # 최대 재연결 시도 횟수
         self._reconnect_backoff_sec: float = 2.0  # 재연결 대기 시간 (지수 증가)
+        self._consecutive_failures: int = 0  # 연속 재연결 실패 횟수
         
         logger.info(f"하이브리드 전략 초기화")
         logger.info(f"  실시간 종목: {len(self.realtime_stocks)}개")
@@ -113,16 +241,19 @@ class HybridStrategy:
         logger.info("=" * 60)
         
         self.is_running = True
+        self._stop_event.clear()
+        
+        # stop()으로 종료된 조회 스레드 풀은 재사용할 수 없으므로 새로 생성
+        if self._io_pool is None:
+            self._io_pool = self._create_io_pool()
         
         # 1. 실시간 종목 초기화 및 WebSocket 구독
         self._init_realtime_stocks()
+        self._start_signal_thread()
         self._subscribe_realtime()
         
-        # 2. 폴링 스레드 시작
-        self._start_polling_thread()
-        
-        # 3. WebSocket 모니터링 스레드 시작
-        self._start_monitor_thread()
+        # 2. 백그라운드 스레드 시작 (폴링 + WebSocket 모니터링)
+        self._start_background_thread()
         
         logger.info("✅ 전략 시작 완료")
     
@@ -130,28 +261,57 @@ class HybridStrategy:
         """전략 중지"""
         logger.info("전략 중지 중...")
         self.is_running = False
+        self._stop_event.set()
         
         # WebSocket 구독 해제
         self._unsubscribe_all()
         
-        # 폴링 스레드 종료 대기
-        if self._polling_thread and self._polling_thread.is_alive():
-            self._polling_thread.join(timeout=5)
+        # 신호 처리 스레드 종료 대기
+        self._tick_event.set()
+        if self._signal_thread and self._signal_thread.is_alive():
+            self._signal_thread.join(timeout=5)
+        
+        # 백그라운드 스레드 종료 대기
+        if self._background_thread and self._background_thread.is_alive():
+            self._background_thread.join(timeout=5)
         
-        # 모니터링 스레드 종료 대기
-        if self._monitor_thread and self._monitor_thread.is_alive():
-            self._monitor_thread.join(timeout=5)
+        # 대기 중인 조회 작업 취소
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._io_pool = None
         
         logger.info("✅ 전략 중지 완료")
     
+    def _create_io_pool(self) -> ThreadPoolExecutor:
+        """REST 조회용 스레드 풀 생성 (작업 스레드 수는 연결 풀 크기 이하)"""
+        return ThreadPoolExecutor(
+            max_workers=max(1, min(ma_config.api_workers, _HTTP_POOL_MAXSIZE)),
+            thread_name_prefix="hybrid-io"
+        )
+    
     def _init_realtime_stocks(self):
         """실시간 종목 초기화 (과거 데이터로 MA 미리 계산)"""
         logger.info(f"\n📊 실시간 종목 초기화 ({len(self.realtime_stocks)}개)...")
         
-        for symbol, name in self.realtime_stocks.items():
-            # 현재가 조회
-            price_info = self.client.get_current_price(symbol)
-            
+        # 현재가/분봉 조회는 스레드 풀에서 동시에, 결과 반영은 종목 순서대로
+        stock_list = list(self.realtime_stocks.items())
+        init_data = self._io_pool.map(self._fetch_init_data, [symbol for symbol, _ in stock_list])
+        
+        # 새 딕셔너리에 모두 만든 뒤 한 번에 교체
+        # (재초기화 중에도 신호 처리 스레드는 이전/새 데이터 중 하나만 온전히 보게 됨)
+        realtime_data: Dict[str, RealtimeStock] = {}
+        
+        # 전 종목 링 버퍼/상태를 각각 연속된 2차원 배열 하나에 할당하고 종목별로 행 뷰를 사용
+        # (종목마다 작은 배열을 따로 할당하지 않음, 행 뷰는 C 연속이라 커널에 그대로 전달)
+        price_bufs = np.zeros((len(stock_list), self.long_ma), dtype=np.int32)
+        rings = np.zeros((len(stock_list), RING_SIZE), dtype=np.int64)
+        
+        # 종목별 로그는 DEBUG일 때만 포맷, 결과는 마지막에 요약 한 줄로 기록
+        # (재연결마다 반복되는 초기화에서 로그 레코드 수를 종목 수와 무관하게 유지)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        ready: List[str] = []
+        
+        for i, ((symbol, name), (price_info, df, error)) in enumerate(zip(stock_list, init_data)):
             if price_info:
                 stock = RealtimeStock(
                     symbol=symbol,
@@ -160,58 +320,105 @@ class HybridStrategy:
                     prev_close=int(price_info.get('prev_close', 0)),
                     high=int(price_info.get('high', 0)),
                     low=int(price_info.get('low', 0)),
-                    volume=int(price_info.get('volume', 0))
+                    volume=int(price_info.get('volume', 0)),
+                    price_buf=price_bufs[i],
+                    ring=rings[i]
                 )
                 
                 # 과거 분봉 데이터로 MA 미리 계산
                 try:
-                    df = self.client.get_minute_chart_df(symbol, period=ma_config.chart_period)
-                    if df is not None and len(df) >= self.long_ma:
-                        # 최근 long_ma개 종가를 히스토리에 추가
-                        prices = df['close'].tail(self.long_ma).tolist()
-                        stock.price_history = [int(p) for p in prices]
-                        stock.ma_short = sum(stock.price_history[-self.short_ma:]) / self.short_ma
-                        stock.ma_long = sum(stock.price_history) / self.long_ma
-                        logger.debug(f"  ✅ {name}: {stock.price:,}원 (MA{self.short_ma}:{stock.ma_short:,.0f}, MA{self.long_ma}:{stock.ma_long:,.0f})")
-                    else:
+                    if error is not None:
+                        if debug:
+                            logger.debug(f"  ⚠️ {name}: 분봉 조회 실패 - {error}")
+                    elif df is not None and len(df) >= self.long_ma:
+                        # 최근 long_ma개 종가로 링 버퍼를 채움 (head는 다시 0 = 가장 오래된 값 위치)
+                        # (파이썬 int 리스트를 거치지 않고 int32 버퍼에 바로 기록, 합계는 int64로 누적)
+                        buf = stock.price_buf
+                        ring = stock.ring
+                        buf[:] = df['close'].to_numpy()[-self.long_ma:].astype(np.int32)
+                        ring[RING_COUNT] = self.long_ma
+                        ring[RING_STATE] = MA_FULL
+                        ring[RING_SHORT_SUM] = buf[-self.short_ma:].sum(dtype=np.int64)
+                        ring[RING_LONG_SUM] = buf.sum(dtype=np.int64)
+                        stock.ma_short = ring[RING_SHORT_SUM] / self.short_ma
+                        stock.ma_long = ring[RING_LONG_SUM] / self.long_ma
+                        ready.append(name)
+                        if debug:
+                            logger.debug(f"  ✅ {name}: {stock.price:,}원 (MA{self.short_ma}:{stock.ma_short:,.0f}, MA{self.long_ma}:{stock.ma_long:,.0f})")
+                    elif debug:
                         logger.debug(f"  ⚠️ {name}: MA 계산 불가 (데이터 부족)")
                 except Exception as e:
-                    logger.debug(f"  ⚠️ {name}: 분봉 조회 실패 - {e}")
+                    if debug:
+                        logger.debug(f"  ⚠️ {name}: 분봉 조회 실패 - {e}")
                 
-                self.realtime_data[symbol] = stock
+                realtime_data[symbol] = stock
             else:
-                self.realtime_data[symbol] = RealtimeStock(symbol=symbol, name=name)
+                realtime_data[symbol] = RealtimeStock(
+                    symbol=symbol, name=name, price_buf=price_bufs[i], ring=rings[i]
+                )
                 logger.warning(f"  ⚠️ {name}: 초기화 실패")
-            
-            time.sleep(0.5)  # API 호출 간격 (분봉 조회 추가로 늘림)
+        
+        self.realtime_data = realtime_data
+        logger.info(f"✅ MA 준비 {len(ready)}/{len(stock_list)}개: {_preview_names(ready)}")
+    
+    def _fetch_init_data(self, symbol: str):
+        """
+        실시간 종목 초기화용 현재가 + 과거 분봉 조회 (스레드 풀 작업)
+        
+        Returns:
+            tuple: (현재가 정보, 분봉 DataFrame, 분봉 조회 예외)
+        """
+        self._init_rate_limiter.acquire()
+        price_info = self.client.get_current_price(symbol)
+        if not price_info:
+            return price_info, None, None
+        
+        self._init_rate_limiter.acquire()
+        try:
+            return price_info, self.client.get_minute_chart_df(symbol, period=ma_config.chart_period), None
+        except Exception as e:
+            return price_info, None, e
     
     def _subscribe_realtime(self):
         """WebSocket 실시간 구독"""
         logger.info(f"\n📡 WebSocket 실시간 구독 시작...")
         
-        for symbol, name in self.realtime_stocks.items():
-            try:
-                stock = self.client.kis.stock(symbol)
-                
-                # 실시간 체결가 구독
-                ticket = stock.on("price", self._on_price_update)
-                self._subscriptions.append(ticket)
-                
-                logger.debug(f"  ✅ {name}({symbol}) 구독 완료")
-                
-            except Exception as e:
-                logger.error(f"  ❌ {name}({symbol}) 구독 실패: {e}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        subscribed: List[str] = []
         
-        logger.info(f"✅ {len(self._subscriptions)}개 종목 실시간 구독 완료")
+        with self._subscriptions_lock:
+            for symbol, name in self.realtime_stocks.items():
+                try:
+                    stock = self._stock_objs.get(symbol)
+                    if stock is None:
+                        stock = self.client.kis.stock(symbol)
+                        self._stock_objs[symbol] = stock
+                    
+                    # 실시간 체결가 구독
+                    ticket = stock.on("price", self._on_price_update)
+                    self._subscriptions.append(ticket)
+                    self._subscriptions_count += 1
+                    subscribed.append(name)
+                    
+                    if debug:
+                        logger.debug(f"  ✅ {name}({symbol}) 구독 완료")
+                
+                except Exception as e:
+                    logger.error(f"  ❌ {name}({symbol}) 구독 실패: {e}")
+            
+            logger.info(f"✅ {self._subscriptions_count}개 종목 실시간 구독 완료: {_preview_names(subscribed)}")
     
     def _unsubscribe_all(self):
         """모든 WebSocket 구독 해제"""
-        for ticket in self._subscriptions:
-            try:
-                ticket.unsubscribe()
-            except:
-                pass
-        self._subscriptions = []
+        with self._subscriptions_lock:
+            for ticket in self._subscriptions:
+                try:
+                    ticket.unsubscribe()
+                except Exception as e:
+                    # 이미 끊긴 연결의 티켓 등 - 재연결 중 반복되므로 DEBUG로만 기록
+                    logger.debug("구독 해제 실패: %s", e)
+            self._subscriptions = []
+            self._subscriptions_count = 0
     
     def _reconnect_websocket(self) -> bool:
         """
@@ -233,15 +440,16 @@ class HybridStrategy:
         # 기존 구독 해제
         self._unsubscribe_all()
         
-        # 지수 백오프 대기
-        time.sleep(wait_time)
+        # 지수 백오프 대기 (대기 중 stop() 호출 시 재구독하지 않음)
+        if self._stop_event.wait(timeout=wait_time):
+            return False
         
         try:
             # 재구독
             self._subscribe_realtime()
             
             # 마지막 업데이트 시간 리셋
-            self._last_realtime_update = datetime.now()
+            self._last_realtime_update_ns = time.monotonic_ns()
             
             # 성공 시 백오프 리셋
             if self._reconnect_count > 3:
@@ -254,224 +462,263 @@ class HybridStrategy:
             logger.error(f"❌ WebSocket 재연결 실패: {e}")
             return False
     
-    def _monitor_websocket(self):
-        """WebSocket 연결 상태 모니터링 스레드"""
-        logger.info("🔍 WebSocket 모니터링 시작")
-        logger.info(f"   타임아웃: {self._websocket_timeout_sec}초, 최대 재연결: {self._max_reconnect_attempts}회")
-        
-        consecutive_failures = 0
-        
-        while self.is_running:
-            try:
-                # 30초마다 체크
-                time.sleep(30)
-                
-                if not self.is_running:
-                    break
+    def _check_websocket_if_due(self):
+        """WebSocket 점검 시각이 지났으면 점검 (백그라운드 루프와 폴링 조각 사이에서 호출)"""
+        if time.monotonic() >= self._next_websocket_check:
+            self._check_websocket()
+            self._next_websocket_check = time.monotonic() + self._monitor_interval_sec
+    
+    def _check_websocket(self):
+        """WebSocket 연결 상태 점검 (데이터 수신이 끊겼으면 재연결)"""
+        try:
+            # 마지막 데이터 수신 후 경과 시간
+            elapsed = (time.monotonic_ns() - self._last_realtime_update_ns) / 1e9
+            
+            if elapsed > self._websocket_timeout_sec:
+                logger.warning(f"⚠️ WebSocket 데이터 수신 없음 ({elapsed:.0f}초 경과)")
                 
-                # 마지막 데이터 수신 후 경과 시간
-                elapsed = (datetime.now() - self._last_realtime_update).total_seconds()
+                success = self._reconnect_websocket()
                 
-                if elapsed > self._websocket_timeout_sec:
-                    logger.warning(f"⚠️ WebSocket 데이터 수신 없음 ({elapsed:.0f}초 경과)")
-                    
-                    success = self._reconnect_websocket()
-                    
-                    if success:
-                        consecutive_failures = 0
-                    else:
-                        consecutive_failures += 1
-                        
-                        # 연속 5회 실패 시 전체 재초기화
-                        if consecutive_failures >= 5:
-                            logger.warning("🔄 연속 재연결 실패, 전체 재초기화 시도...")
-                            self._init_realtime_stocks()
-                            self._subscribe_realtime()
-                            consecutive_failures = 0
+                if success:
+                    self._consecutive_failures = 0
                 else:
-                    # 정상 동작 중이면 실패 카운터 리셋
-                    consecutive_failures = 0
+                    self._consecutive_failures += 1
                     
-            except Exception as e:
-                logger.error(f"WebSocket 모니터링 오류: {e}")
-                consecutive_failures += 1
+                    # 연속 5회 실패 시 전체 재초기화
+                    if self._consecutive_failures >= 5 and self.is_running:
+                        logger.warning("🔄 연속 재연결 실패, 전체 재초기화 시도...")
+                        self._init_realtime_stocks()
+                        self._subscribe_realtime()
+                        self._consecutive_failures = 0
+            else:
+                # 정상 동작 중이면 실패 카운터 리셋
+                self._consecutive_failures = 0
         
-        logger.info("🔍 WebSocket 모니터링 종료")
+        except Exception as e:
+            logger.error(f"WebSocket 모니터링 오류: {e}")
+            self._consecutive_failures += 1
     
     def _on_price_update(self, sender: KisWebsocketClient, e: KisSubscriptionEventArgs[KisRealtimePrice]):
-        """실시간 체결가 수신 콜백"""
+        """실시간 체결가 수신 콜백 (틱을 큐에 넣고 즉시 반환)"""
         try:
             price_data = e.response
-            symbol = price_data.symbol
+            queue = self._tick_queue
+            if len(queue) == queue.maxlen:
+                self._dropped_ticks += 1  # 가득 찬 큐에 넣으면 가장 오래된 틱이 밀려남
+            queue.append((price_data.symbol, price_data.price, price_data.change, price_data.volume))
+            self._tick_event.set()
             
-            if symbol not in self.realtime_data:
+            # WebSocket 연결 상태 업데이트
+            self._last_realtime_update_ns = time.monotonic_ns()
+        
+        except Exception as e:
+            logger.error(f"실시간 데이터 수신 오류: {e}")
+    
+    def _signal_loop(self):
+        """신호 처리 루프 (틱 큐 소비, 틱 유실 시 주기적으로 경고)"""
+        reported_drops = 0
+        next_drop_warn = 0.0
+        
+        while self.is_running:
+            self._tick_event.wait()
+            self._tick_event.clear()
+            self._drain_ticks()
+            
+            # 처리 지연으로 버려진 틱이 있으면 MA 링 버퍼에 빠진 가격이 있다는 뜻 → 경고
+            dropped = self._dropped_ticks
+            if dropped != reported_drops:
+                now = time.monotonic()
+                if now >= next_drop_warn:
+                    logger.warning(f"⚠️ 틱 처리 지연으로 {dropped - reported_drops}개 틱 유실 (누적 {dropped}개)")
+                    reported_drops = dropped
+                    next_drop_warn = now + self._drop_warn_interval_sec
+    
+    def _drain_ticks(self):
+        """큐에 쌓인 틱을 도착 순서대로 모두 처리"""
+        queue = self._tick_queue
+        process_tick = self._process_tick
+        while queue:
+            process_tick(*queue.popleft())
+    
+    def _process_tick(self, symbol: str, price, change, volume):
+        """실시간 틱 처리 (MA 갱신 + 신호/익절/손절 체크)"""
+        try:
+            stock = self.realtime_data.get(symbol)
+            if stock is None:
                 return
             
-            stock = self.realtime_data[symbol]
-            old_price = stock.price
-            
             # 데이터 업데이트 (Decimal -> int 변환)
-            stock.price = int(price_data.price)
-            stock.change = int(price_data.change)
-            stock.volume = int(price_data.volume)
-            stock.last_update = datetime.now()
-            
-            # WebSocket 연결 상태 업데이트
-            self._last_realtime_update = datetime.now()
-            
-            # 가격 히스토리 업데이트 (MA 계산용)
-            stock.price_history.append(int(price_data.price))
-            if len(stock.price_history) > self.long_ma:
-                stock.price_history = stock.price_history[-self.long_ma:]
-            
-            # MA 계산
-            if len(stock.price_history) >= self.short_ma:
-                stock.ma_short = sum(stock.price_history[-self.short_ma:]) / self.short_ma
-            if len(stock.price_history) >= self.long_ma:
-                stock.ma_long = sum(stock.price_history[-self.long_ma:]) / self.long_ma
-            
-            # 신호 체크
-            self._check_realtime_signal(symbol, old_price)
-            
-            # 익절/손절 체크 (보유 중인 종목)
-            self._check_take_profit_stop_loss(symbol, int(price_data.price))
+            price = int(price)
+            stock.price = price
+            stock.change = int(change)
+            stock.volume = int(volume)
+            stock.last_update_ns = time.monotonic_ns()
+            
+            # 링 버퍼/누적합/MA 갱신 + 크로스 판단은 컴파일된 커널에서 한 번에 처리
+            # (준비 안 된 MA는 0.0, 신호는 장기 MA까지 준비된 종목만)
+            signal, stock.ma_short, stock.ma_long = ma_tick_update(
+                stock.price_buf, stock.ring, price, self.short_ma, self._gap_thresh_frac
+            )
+            
+            # 매매 판단 (관망 신호의 미보유 종목은 메서드 호출 없이 통과)
+            if signal or symbol in self._positions_keys:
+                self._on_tick_decide(symbol, stock, price, signal)
             
         except Exception as e:
-            logger.error(f"실시간 데이터 처리 오류: {e}")
+            logger.error("실시간 데이터 처리 오류: %s", e)
     
-    def _check_realtime_signal(self, symbol: str, old_price: int):
-        """실시간 매매 신호 체크"""
-        stock = self.realtime_data[symbol]
+    def _on_tick_decide(self, symbol: str, stock: RealtimeStock, price: int, signal: int):
+        """
+        실시간 틱 매매 판단 (보유 여부를 한 번만 조회)
         
-        # MA가 계산되지 않았으면 스킵
-        if stock.ma_short == 0 or stock.ma_long == 0:
-            return
+        보유 종목: 손절 → 익절 → 데드크로스 매도 순으로 확인
+        미보유 종목: 골든크로스(기준 괴리 이상)일 때 매수
         
-        # 골든크로스 체크 (단기 MA가 장기 MA 상향 돌파)
-        if stock.ma_short > stock.ma_long:
-            ma_gap = (stock.ma_short - stock.ma_long) / stock.ma_long * 100
-            
-            if ma_gap > ma_config.min_ma_gap_pct:
-                # 매수 신호
-                if symbol not in self.positions:
+        Args:
+            stock: 틱이 반영된 실시간 종목 데이터
+            price: _process_tick에서 이미 int로 변환한 체결가
+            signal: ma_tick_update 결과 (1 = 매수 조건, -1 = 매도 조건, 0 = 관망)
+        """
+        position = self.positions.get(symbol)
+        
+        if position is None:
+            # 골든크로스 (단기 MA가 장기 MA보다 기준 괴리 이상 위) → 매수 신호
+            if signal > 0:
+                if logger.isEnabledFor(logging.INFO):
                     logger.info(f"\n🔔 [실시간] 매수 신호: {stock.name}")
-                    logger.info(f"   현재가: {int(stock.price):,}원")
+                    logger.info(f"   현재가: {price:,}원")
                     logger.info(f"   MA{self.short_ma}: {stock.ma_short:,.0f} > MA{self.long_ma}: {stock.ma_long:,.0f}")
-                    self._execute_buy(symbol, stock.name, int(stock.price))
-        
-        # 데드크로스 체크 (단기 MA가 장기 MA 하향 돌파)
-        elif stock.ma_short < stock.ma_long:
-            if symbol in self.positions:
-                logger.info(f"\n🔔 [실시간] 매도 신호: {stock.name}")
-                logger.info(f"   현재가: {int(stock.price):,}원")
-                self._execute_sell(symbol, stock.name, int(stock.price), "SIGNAL")
-    
-    def _check_take_profit_stop_loss(self, symbol: str, current_price: int):
-        """실시간 익절/손절 체크"""
-        if symbol not in self.positions:
+                self._execute_buy(symbol, stock.name, price)
             return
         
-        position = self.positions[symbol]
-        entry_price = int(position['entry_price'])
+        entry_price = position['entry_price']  # 매수 시 int로 저장됨
         name = position['name']
         
         # 수익률 계산
-        gross_pnl_pct = (current_price - entry_price) / entry_price * 100
+        gross_pnl_pct = (price - entry_price) / entry_price * 100
         
         # 손절 체크
-        stop_loss_pct = ma_config.stop_loss_pct  # 기본값: -1.0%
+        stop_loss_pct = self._stop_loss_pct
         if gross_pnl_pct <= stop_loss_pct:
-            logger.info(f"\n🛑 [실시간] 손절 신호: {name}")
-            logger.info(f"   현재가: {current_price:,}원 | 수익률: {gross_pnl_pct:+.2f}% <= 손절기준 {stop_loss_pct}%")
-            self._execute_sell(symbol, name, current_price, "STOP_LOSS")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"\n🛑 [실시간] 손절 신호: {name}")
+                logger.info(f"   현재가: {price:,}원 | 수익률: {gross_pnl_pct:+.2f}% <= 손절기준 {stop_loss_pct}%")
+            self._execute_sell(symbol, name, price, "STOP_LOSS")
             return
         
         # 익절 체크 (손익분기점 초과 시)
-        if gross_pnl_pct >= self.break_even_rate:
-            logger.info(f"\n💰 [실시간] 익절 신호: {name}")
-            logger.info(f"   현재가: {current_price:,}원 | 수익률: {gross_pnl_pct:+.2f}% >= 손익분기 {self.break_even_rate:.2f}%")
-            self._execute_sell(symbol, name, current_price, "TAKE_PROFIT")
-    
-    def _start_polling_thread(self):
-        """폴링 스레드 시작"""
-        self._polling_thread = threading.Thread(target=self._polling_loop, daemon=True)
-        self._polling_thread.start()
-        logger.info(f"📊 폴링 스레드 시작 (10분 간격, {len(self.polling_stocks)}개 종목)")
-    
-    def _start_monitor_thread(self):
-        """WebSocket 모니터링 스레드 시작"""
-        self._monitor_thread = threading.Thread(target=self._monitor_websocket, daemon=True)
-        self._monitor_thread.start()
-        logger.info(f"🔍 WebSocket 모니터링 스레드 시작 (타임아웃: {self._websocket_timeout_sec}초)")
-    
-    def _polling_loop(self):
-        """폴링 루프 (10분봉 분석)"""
+        break_even_rate = self.break_even_rate
+        if gross_pnl_pct >= break_even_rate:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"\n💰 [실시간] 익절 신호: {name}")
+                logger.info(f"   현재가: {price:,}원 | 수익률: {gross_pnl_pct:+.2f}% >= 손익분기 {break_even_rate:.2f}%")
+            self._execute_sell(symbol, name, price, "TAKE_PROFIT")
+            return
+        
+        # 데드크로스 (단기 MA가 장기 MA 아래) → 매도 신호
+        if signal < 0:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"\n🔔 [실시간] 매도 신호: {name}")
+                logger.info(f"   현재가: {price:,}원")
+            self._execute_sell(symbol, name, price, "SIGNAL")
+    
+    def _start_signal_thread(self):
+        """실시간 신호 처리 스레드 시작"""
+        self._signal_thread = threading.Thread(target=self._signal_loop, daemon=True)
+        self._signal_thread.start()
+    
+    def _start_background_thread(self):
+        """백그라운드 스레드 시작 (폴링 + WebSocket 모니터링)"""
+        self._background_thread = threading.Thread(target=self._background_loop, daemon=True)
+        self._background_thread.start()
+        logger.info(f"📊 폴링 시작 ({self._polling_interval_sec // 60}분 간격, {len(self.polling_stocks)}개 종목)")
+        logger.info(f"🔍 WebSocket 모니터링 시작 (타임아웃: {self._websocket_timeout_sec}초, 최대 재연결: {self._max_reconnect_attempts}회)")
+    
+    def _background_loop(self):
+        """
+        백그라운드 루프
+        
+        폴링 분석(10분 간격, 시작 즉시 1회)과 WebSocket 점검(30초 간격)을
+        다음 실행 시각까지 stop 이벤트로 대기하며 한 스레드에서 번갈아 실행합니다.
+        폴링 한 바퀴 중에도 조각 사이에서 점검하므로 정체 감지가 폴링 시간만큼 밀리지 않습니다.
+        """
+        next_poll = time.monotonic()
+        self._next_websocket_check = next_poll + self._monitor_interval_sec
+        
         while self.is_running:
-            try:
-                self._analyze_polling_stocks()
-            except Exception as e:
-                logger.error(f"폴링 분석 오류: {e}")
+            now = time.monotonic()
             
-            # 10분 대기
-            for _ in range(600):
-                if not self.is_running:
-                    break
-                time.sleep(1)
+            if now >= next_poll:
+                try:
+                    self._analyze_polling_stocks()
+                except Exception as e:
+                    logger.error(f"폴링 분석 오류: {e}")
+                # 분석이 끝난 시점부터 다음 주기 계산
+                next_poll = time.monotonic() + self._polling_interval_sec
+            
+            elif now >= self._next_websocket_check:
+                self._check_websocket_if_due()
+            
+            # 다음 작업 시각까지 대기 (stop() 호출 시 즉시 종료)
+            elif self._stop_event.wait(timeout=min(next_poll, self._next_websocket_check) - now):
+                break
+        
+        logger.info("🔍 백그라운드 루프 종료")
     
     def _analyze_polling_stocks(self):
         """폴링 종목 분석 (10분봉)"""
         logger.info(f"\n📊 [폴링] {len(self.polling_stocks)}개 종목 분석 시작...")
         
-        batch_size = ma_config.batch_size
-        batch_delay = ma_config.batch_delay
-        api_delay = ma_config.api_delay
-        
-        stock_list = list(self.polling_stocks.items())
+        # 분봉 조회는 스레드 풀에서 동시에 (호출 속도는 토큰 버킷으로 제한),
+        # 신호 판단/주문은 이 스레드에서 조회가 끝난 종목부터 바로 처리
+        # BATCH_SIZE개씩 조각으로 나눠 제출 → 조각 사이마다 WebSocket 점검,
+        # 풀 대기열에도 한 조각만 쌓이므로 재연결 시 초기화 조회가 폴링 뒤에 오래 밀리지 않음
+        symbols = list(self.polling_stocks)
+        slice_size = max(1, ma_config.batch_size)
         
-        for i in range(0, len(stock_list), batch_size):
+        for start in range(0, len(symbols), slice_size):
             if not self.is_running:
                 break
             
-            batch = stock_list[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(stock_list) + batch_size - 1) // batch_size
+            charts = self.client.get_minute_chart_df_batch(
+                symbols[start:start + slice_size],
+                period=ma_config.chart_period,
+                executor=self._io_pool,
+                throttle=self._rate_limiter.acquire
+            )
             
-            logger.info(f"\n📦 배치 {batch_num}/{total_batches} 처리 중...")
-            
-            for symbol, name in batch:
+            for symbol, df in charts:
                 if not self.is_running:
                     break
                 
-                self._analyze_single_stock(symbol, name)
-                time.sleep(api_delay)
+                self._analyze_single_stock(symbol, self.polling_stocks[symbol], df)
             
-            time.sleep(batch_delay)
+            self._check_websocket_if_due()
         
         logger.info(f"✅ [폴링] 분석 완료")
     
-    def _analyze_single_stock(self, symbol: str, name: str):
+    def _analyze_single_stock(self, symbol: str, name: str, df):
         """단일 종목 분석 (10분봉)"""
         try:
-            # 10분봉 데이터 조회
-            df = self.client.get_minute_chart_df(symbol, period=ma_config.chart_period)
-            
-            if df is None or len(df) < self.long_ma:
+            # 크로스오버 판단에는 직전 봉의 장기 MA까지 필요 (long_ma + 1개)
+            if df is None or len(df) < self.long_ma + 1:
                 return
             
-            # MA 계산
-            df['ma_short'] = df['close'].rolling(self.short_ma).mean()
-            df['ma_long'] = df['close'].rolling(self.long_ma).mean()
+            # MA 계산 (전체 rolling 대신 마지막 long_ma + 1개 종가의 누적합 한 번으로
+            # 현재/직전 봉의 단기·장기 윈도우 합계 4개를 모두 차분으로 구함)
+            # 전체 열이 아닌 마지막 long_ma + 1개만 float64로 변환
+            closes = df['close'].to_numpy()[-self.long_ma - 1:].astype(np.float64, copy=False)
+            csum = np.cumsum(closes)
+            ma_short = (csum[-1] - csum[-1 - self.short_ma]) / self.short_ma
+            ma_long = (csum[-1] - csum[0]) / self.long_ma
+            prev_ma_short = (csum[-2] - csum[-2 - self.short_ma]) / self.short_ma
+            prev_ma_long = csum[-2] / self.long_ma
             
-            current = df.iloc[-1]
-            prev = df.iloc[-2] if len(df) > 1 else current
-            
-            price = int(current['close'])
-            ma_short = current['ma_short']
-            ma_long = current['ma_long']
+            price = int(closes[-1])
             
             # 크로스오버 체크
-            golden_cross = prev['ma_short'] <= prev['ma_long'] and ma_short > ma_long
-            death_cross = prev['ma_short'] >= prev['ma_long'] and ma_short < ma_long
+            golden_cross = prev_ma_short <= prev_ma_long and ma_short > ma_long
+            death_cross = prev_ma_short >= prev_ma_long and ma_short < ma_long
             
             if golden_cross:
                 logger.info(f"\n🔔 [폴링] 골든크로스: {name}")
@@ -484,25 +731,56 @@ class HybridStrategy:
                 self._execute_sell(symbol, name, price, "SIGNAL")
             
         except Exception as e:
-            logger.debug(f"종목 분석 실패 ({name}): {e}")
+            logger.debug("종목 분석 실패 (%s): %s", name, e)
+    
+    def _try_claim(self, symbol: str, held: bool) -> bool:
+        """
+        종목 주문 선점 (같은 종목 주문이 동시에 두 번 나가지 않도록)
+        
+        Args:
+            held: 주문 가능 조건의 보유 여부 (매수 False, 매도 True)
+        
+        Returns:
+            bool: 선점 성공 여부 (이미 주문 진행 중이거나 보유 상태가 다르면 False)
+        """
+        with self._positions_lock:
+            if symbol in self._in_flight or (symbol in self.positions) != held:
+                return False
+            self._in_flight.add(symbol)
+            return True
+    
+    def _release_claim(self, symbol: str):
+        """종목 주문 선점 해제"""
+        with self._positions_lock:
+            self._in_flight.discard(symbol)
     
     def _execute_buy(self, symbol: str, name: str, price: int):
-        """매수 실행"""
-        if symbol in self.positions:
-            logger.info(f"   ℹ️ 이미 보유 중 - 스킵")
+        """매수 실행 (주문 진행 중/보유 중인 종목은 스킵)"""
+        if not self._try_claim(symbol, held=False):
+            logger.info(f"   ℹ️ 이미 보유 중이거나 주문 진행 중 - 스킵")
             return
         
+        try:
+            self._place_buy(symbol, name, price)
+        finally:
+            self._release_claim(symbol)
+    
+    def _place_buy(self, symbol: str, name: str, price: int):
+        """매수 주문 (_execute_buy에서 종목 선점 후 호출)"""
         logger.info(f"   💰 매수 주문: {name} {self.order_quantity}주 @ {price:,}원")
         
-        order = self.client.buy_market_order(symbol, self.order_quantity)
+        order = self.client.buy_market_order(symbol, self.order_quantity, stock=self._stock_objs.get(symbol))
         
         if order:
-            self.positions[symbol] = {
-                'name': name,
-                'entry_price': price,
-                'quantity': self.order_quantity,
-                'entry_time': datetime.now()
-            }
+            with self._positions_lock:
+                self.positions[symbol] = {
+                    'name': name,
+                    'entry_price': price,
+                    'quantity': self.order_quantity,
+                    'entry_time': datetime.now()
+                }
+                self._positions_keys = frozenset(self.positions)
+                self._positions_count = len(self.positions)
             self.orders_placed += 1
             
             # 잔고 조회 및 표시
@@ -515,11 +793,21 @@ class HybridStrategy:
             logger.error(f"   ❌ 매수 실패")
     
     def _execute_sell(self, symbol: str, name: str, price: int, reason: str):
-        """매도 실행 (수수료 고려)"""
-        if symbol not in self.positions:
+        """매도 실행 (미보유/주문 진행 중인 종목은 스킵)"""
+        if not self._try_claim(symbol, held=True):
+            return
+        
+        try:
+            self._place_sell(symbol, name, price, reason)
+        finally:
+            self._release_claim(symbol)
+    
+    def _place_sell(self, symbol: str, name: str, price: int, reason: str):
+        """매도 주문 (수수료 고려, _execute_sell에서 종목 선점 후 호출)"""
+        position = self.positions.get(symbol)
+        if position is None:
             return
         
-        position = self.positions[symbol]
         entry_price = int(position['entry_price'])
         quantity = int(position['quantity'])
         gross_pnl_pct = (price - entry_price) / entry_price * 100
@@ -529,8 +817,8 @@ class HybridStrategy:
         net_pnl_pct = profit_info['net_profit_rate']
         
         # 수수료 고려 수익성 체크 (손절은 예외)
-        if self.fee_config.use_fee_aware_sell and reason == "SIGNAL":
-            stop_loss_pct = ma_config.stop_loss_pct  # 기본값: -1.0%
+        if self._use_fee_aware_sell and reason == "SIGNAL":
+            stop_loss_pct = self._stop_loss_pct
             
             # 1. 손절 기준 이하면 즉시 매도 (큰 손실 방지)
             if gross_pnl_pct <= stop_loss_pct:
@@ -538,16 +826,19 @@ class HybridStrategy:
                 # 손절은 아래로 계속 진행
             
             # 2. 소폭 손실 시 매도 보류 (반등 기회 대기)
+            # (보류는 데드크로스 유지 중 매 틱 반복되므로 로그 레벨 확인 후 포맷)
             elif gross_pnl_pct < 0:
-                logger.info(f"   ⏸️ 매도 보류 ({name}): 소폭 손실 {gross_pnl_pct:+.2f}% (손절기준: {stop_loss_pct}%)")
-                logger.info(f"      반등 대기 중...")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"   ⏸️ 매도 보류 ({name}): 소폭 손실 {gross_pnl_pct:+.2f}% (손절기준: {stop_loss_pct}%)")
+                    logger.info(f"      반등 대기 중...")
                 self.fee_saved_count += 1
                 return
             
             # 3. 수익이지만 손익분기점 미달 시 매도 보류
             elif gross_pnl_pct > 0 and gross_pnl_pct < self.break_even_rate:
-                logger.info(f"   ⏸️ 매도 보류 ({name}): 수익률 {gross_pnl_pct:+.2f}% < 손익분기 {self.break_even_rate:.2f}%")
-                logger.info(f"      수수료 차감 시 손실 예상 (순수익률: {net_pnl_pct:+.2f}%)")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"   ⏸️ 매도 보류 ({name}): 수익률 {gross_pnl_pct:+.2f}% < 손익분기 {self.break_even_rate:.2f}%")
+                    logger.info(f"      수수료 차감 시 손실 예상 (순수익률: {net_pnl_pct:+.2f}%)")
                 self.fee_saved_count += 1
                 return
         
@@ -556,10 +847,13 @@ class HybridStrategy:
         logger.info(f"      {pnl_emoji} {entry_price:,}원 → {price:,}원")
         logger.info(f"      총수익: {gross_pnl_pct:+.2f}% | 수수료: {profit_info['total_fee']:,}원 | 순수익: {net_pnl_pct:+.2f}%")
         
-        order = self.client.sell_market_order(symbol, quantity)
+        order = self.client.sell_market_order(symbol, quantity, stock=self._stock_objs.get(symbol))
         
         if order:
-            del self.positions[symbol]
+            with self._positions_lock:
+                self.positions.pop(symbol, None)
+                self._positions_keys = frozenset(self.positions)
+                self._positions_count = len(self.positions)
             self.orders_placed += 1
             
             # 잔고 조회 및 표시
@@ -577,8 +871,9 @@ class HybridStrategy:
             'is_running': self.is_running,
             'realtime_stocks': len(self.realtime_stocks),
             'polling_stocks': len(self.polling_stocks),
-            'subscriptions': len(self._subscriptions),
-            'positions': len(self.positions),
+            'subscriptions': self._subscriptions_count,
+            'dropped_ticks': self._dropped_ticks,
+            'positions': self._positions_count,
             'orders_placed': self.orders_placed,
             'fee_saved_count': self.fee_saved_count  # 수수료로 인해 스킵한 매도 횟수
         }
@@ -603,7 +898,7 @@ def run_hybrid_strategy(stock_group: str = "kospi200"):
     
     print("\n" + "=" * 60)
     print("🚀 하이브리드 실시간 + 폴링 전략")
-    print("   상위 40개: WebSocket 실시간")
+    print(f"   상위 {min(ma_config.websocket_stocks, HybridStrategy.MAX_WEBSOCKET_STOCKS)}개: WebSocket 실시간")
     print("   나머지: 10분봉 폴링")
     print("=" * 60)
     
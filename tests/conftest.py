@@ -0,0 +1,43 @@
+"""
+테스트 공통 설정
+Shared pytest setup
+
+- 저장소 루트를 import 경로에 추가 (전략 모듈은 평면 구조)
+- python-kis(pykis)가 설치되어 있지 않으면 kis_client/strategy_hybrid import에 필요한
+  이름만 가진 대체 모듈을 등록 (테스트는 KIS API를 호출하지 않는 전략 로직만 검증)
+"""
+
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _install_pykis_stub():
+    """pykis 대체 모듈 등록 (import 시점에 필요한 이름만 제공)"""
+    class _Placeholder:
+        def __class_getitem__(cls, item):
+            return cls
+    
+    def placeholder(name: str):
+        return type(name, (_Placeholder,), {})
+    
+    pykis = types.ModuleType("pykis")
+    for name in ("PyKis", "KisRealtimePrice", "KisSubscriptionEventArgs", "KisWebsocketClient"):
+        setattr(pykis, name, placeholder(name))
+    
+    modules = {"pykis": pykis}
+    for path in ("pykis.api", "pykis.api.account", "pykis.api.account.order"):
+        modules[path] = types.ModuleType(path)
+    modules["pykis.api.account.order"].KisOrder = placeholder("KisOrder")
+    
+    sys.modules.update(modules)
+
+
+try:
+    from pykis import PyKis  # noqa: F401
+except ImportError:
+    _install_pykis_stub()
@@ -0,0 +1,62 @@
+"""
+strategy_cosmetics.py - 실시간 신호용 SMA 캐시 테스트
+Incremental SMA cache vs. full recompute
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cosmetics_config import CosmeticsStrategyConfig
+from strategy_cosmetics import CosmeticsTrendStrategy
+
+
+SHORT_MA = 3
+LONG_MA = 5
+
+
+def _daily_frame(closes):
+    """영업일 인덱스의 종가 DataFrame"""
+    index = pd.bdate_range("2026-01-05", periods=len(closes))
+    return pd.DataFrame({"close": closes}, index=index)
+
+
+def _ma_pair(strategy, df, incremental):
+    signal = strategy.generate_current_signals({"000001": df}, incremental=incremental)[0]
+    return signal.short_ma, signal.long_ma, signal.signal_type
+
+
+@pytest.fixture
+def strategy():
+    return CosmeticsTrendStrategy(
+        config=CosmeticsStrategyConfig(short_ma_period=SHORT_MA, long_ma_period=LONG_MA)
+    )
+
+
+def test_incremental_matches_full_when_last_bar_changes(strategy):
+    closes = [100.0, 102.0, 101.0, 104.0, 103.0, 105.0, 107.0, 106.0]
+
+    # 1일차: 장중(형성 중) 종가로 캐시 구성
+    day1 = _daily_frame(closes[:-1] + [110.0])
+    incremental = _ma_pair(strategy, day1, True)
+    full = _ma_pair(strategy, day1, False)
+    assert incremental[:2] == pytest.approx(full[:2])
+    assert incremental[2] == full[2]
+
+    # 같은 봉의 확정 종가 + 다음 날 봉 → 형성 중이던 종가는 교체되어야 함
+    day2 = _daily_frame(closes + [95.0])
+    incremental = _ma_pair(strategy, day2, True)
+    full = _ma_pair(strategy, day2, False)
+    assert incremental[:2] == pytest.approx(full[:2])
+    assert incremental[2] == full[2]
+
+
+def test_incremental_matches_full_when_same_bar_is_refetched(strategy):
+    closes = list(np.linspace(100.0, 90.0, 7))
+
+    for last_close in (120.0, 80.0, 91.0):
+        df = _daily_frame(closes + [last_close])
+        incremental = _ma_pair(strategy, df, True)
+        full = _ma_pair(strategy, df, False)
+        assert incremental[:2] == pytest.approx(full[:2])
+        assert incremental[2] == full[2]
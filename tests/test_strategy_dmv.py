@@ -0,0 +1,96 @@
+"""
+strategy_dmv.py - 당일 종목 선별 캐시/거래일 전환 테스트
+Selection cache restore and trading-day rollover
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import strategy_dmv
+from config import dmv_config
+from strategy_dmv import DualMomentumVolatilityStrategy
+
+
+UNIVERSE = ["005930", "000660", "035420"]
+
+
+class FakeClient:
+    """일봉만 제공하는 KIS 클라이언트 대체 (분봉 없음 → 진입 신호 없음)"""
+
+    def __init__(self):
+        self.daily_calls = 0
+
+    def get_daily_prices_df(self, symbol, count=200):
+        self.daily_calls += 1
+        close = 10000 * np.exp(np.linspace(0.0, 0.2, count)) * (1 + int(symbol) % 7 / 100)
+        index = pd.bdate_range(end="2026-10-16", periods=count)
+        return pd.DataFrame(
+            {"open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": 1000.0},
+            index=index,
+        )
+
+    def get_minute_chart_df(self, symbol, period=1, max_retries=3):
+        return None
+
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    """strategy_dmv의 현재 시각 고정 + 선별 캐시 경로를 임시 디렉터리로 변경"""
+    monkeypatch.setattr(dmv_config, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(dmv_config, "entry_start_time", "09:00")
+
+    now = [datetime(2026, 10, 16, 9, 5)]
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now[0]
+
+    monkeypatch.setattr(strategy_dmv, "datetime", FakeDatetime)
+
+    def set_time(*args):
+        now[0] = datetime(*args)
+
+    return set_time
+
+
+def _start(client):
+    strategy = DualMomentumVolatilityStrategy(client, universe=list(UNIVERSE))
+    strategy.on_start()
+    return strategy
+
+
+def test_restart_after_selection_window_keeps_cached_selection(clock):
+    clock(2026, 10, 16, 9, 5)
+    first = _start(FakeClient())
+    first.run_analysis()
+    assert first.selected_stocks
+
+    # 09:10 이후 재시작 → 당일 캐시로 선별 결과/전일 봉 값을 복원하고 그대로 사용
+    clock(2026, 10, 16, 10, 0)
+    client = FakeClient()
+    restarted = _start(client)
+    restarted.run_analysis()
+
+    assert restarted.selected_stocks == first.selected_stocks
+    assert restarted._prev_bars == {symbol: tuple(bar) for symbol, bar in first._prev_bars.items()}
+    assert client.daily_calls == 0
+
+
+def test_next_trading_day_reselects(clock):
+    clock(2026, 10, 16, 9, 5)
+    client = FakeClient()
+    strategy = _start(client)
+    strategy.run_analysis()
+    assert strategy.selected_stocks
+    calls_day1 = client.daily_calls
+
+    # 다음 거래일 선별 시간대: 전날 선별 결과/전일 봉 값을 버리고 다시 조회
+    clock(2026, 10, 19, 9, 5)
+    strategy.run_analysis()
+    assert client.daily_calls > calls_day1
+    assert strategy._selection_date == datetime(2026, 10, 19).date()
+    assert set(strategy._prev_bars) == set(strategy.selected_stocks)